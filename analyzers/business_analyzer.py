@@ -1,7 +1,8 @@
 # analyzers/business_analyzer.py - Business impact analysis
 
 import pandas as pd
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
 
 
 class BusinessAnalyzer:
@@ -34,10 +35,43 @@ class BusinessAnalyzer:
         if df.empty:
             return {'score': 0, 'grade': 'F'}
         
+        avg_time, cv, error_rate, total_size = BusinessAnalyzer.get_ux_stats(df)
+        score, grade = BusinessAnalyzer._score_ux_stats(avg_time, cv, error_rate, total_size)
+        
+        return {
+            'score': score,
+            'grade': grade,
+            'avg_load_time': round(avg_time, 2),
+            'consistency_cv': round(cv, 3),
+            'error_rate': round(error_rate * 100, 2),
+            'total_size_mb': round(total_size / (1024 * 1024), 2)
+        }
+    
+    @staticmethod
+    def get_ux_stats(df: pd.DataFrame) -> Tuple[float, float, float, float]:
+        """
+        Reduce a DataFrame to the four statistics the UX score is based on.
+        
+        Args:
+            df: DataFrame with HAR entries
+            
+        Returns:
+            Tuple of (avg load time ms, coefficient of variation, error rate, total size bytes)
+        """
+        time_stats = df['total_time'].agg(['mean', 'std'])
+        avg_time = float(time_stats['mean'])
+        cv = (float(time_stats['std']) / avg_time) if avg_time > 0 else 0
+        error_rate = float((df['status'] >= 400).mean())
+        total_size = float(df['response_size'].sum())
+        return avg_time, cv, error_rate, total_size
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _score_ux_stats(avg_time: float, cv: float, error_rate: float, total_size: float) -> Tuple[int, str]:
+        """Score UX statistics; pure, so results are memoized per stats tuple."""
         score = 100
         
         # Factor 1: Average load time (40% weight)
-        avg_time = df['total_time'].mean()
         if avg_time > 3000:
             score -= 40
         elif avg_time > 2000:
@@ -48,22 +82,18 @@ class BusinessAnalyzer:
             score -= 10
         
         # Factor 2: Consistency (20% weight)
-        std_dev = df['total_time'].std()
-        cv = (std_dev / avg_time) if avg_time > 0 else 0
         if cv > 1.0:
             score -= 20
         elif cv > 0.5:
             score -= 10
         
         # Factor 3: Error rate (20% weight)
-        error_rate = (df['status'] >= 400).mean()
         if error_rate > 0.05:
             score -= 20
         elif error_rate > 0.02:
             score -= 10
         
         # Factor 4: Resource optimization (20% weight)
-        total_size = df['response_size'].sum()
         if total_size > 5 * 1024 * 1024:  # >5MB
             score -= 20
         elif total_size > 3 * 1024 * 1024:  # >3MB
@@ -83,14 +113,20 @@ class BusinessAnalyzer:
         else:
             grade = 'F'
         
-        return {
-            'score': score,
-            'grade': grade,
-            'avg_load_time': round(avg_time, 2),
-            'consistency_cv': round(cv, 3),
-            'error_rate': round(error_rate * 100, 2),
-            'total_size_mb': round(total_size / (1024 * 1024), 2)
-        }
+        return score, grade
+    
+    @staticmethod
+    def get_avg_load_time_seconds(df: pd.DataFrame) -> float:
+        """
+        Get the average load time, the only DataFrame input of the impact estimates.
+        
+        Args:
+            df: DataFrame with HAR entries
+            
+        Returns:
+            Average total time in seconds
+        """
+        return float(df['total_time'].mean()) / 1000
     
     @staticmethod
     def estimate_conversion_impact(df: pd.DataFrame, baseline_conversion_rate: float = 0.02) -> Dict:
@@ -104,8 +140,24 @@ class BusinessAnalyzer:
         Returns:
             Dictionary with conversion impact estimates
         """
-        avg_time_seconds = df['total_time'].mean() / 1000
+        return BusinessAnalyzer.estimate_conversion_impact_from_load_time(
+            BusinessAnalyzer.get_avg_load_time_seconds(df),
+            baseline_conversion_rate
+        )
+    
+    @staticmethod
+    def estimate_conversion_impact_from_load_time(avg_time_seconds: float,
+                                                  baseline_conversion_rate: float = 0.02) -> Dict:
+        """
+        Estimate conversion rate impact from a precomputed average load time.
         
+        Args:
+            avg_time_seconds: Average load time in seconds
+            baseline_conversion_rate: Baseline conversion rate (default 2%)
+            
+        Returns:
+            Dictionary with conversion impact estimates
+        """
         # Calculate conversion loss
         if avg_time_seconds <= 1:
             conversion_loss = 0
@@ -160,7 +212,38 @@ class BusinessAnalyzer:
         Returns:
             Dictionary with revenue impact estimates
         """
-        conversion_impact = BusinessAnalyzer.estimate_conversion_impact(df, baseline_conversion_rate)
+        return BusinessAnalyzer.estimate_revenue_impact_from_load_time(
+            BusinessAnalyzer.get_avg_load_time_seconds(df),
+            monthly_visitors=monthly_visitors,
+            average_order_value=average_order_value,
+            baseline_conversion_rate=baseline_conversion_rate
+        )
+    
+    @staticmethod
+    def estimate_revenue_impact_from_load_time(
+        avg_time_seconds: float,
+        monthly_visitors: int = 10000,
+        average_order_value: float = 50.0,
+        baseline_conversion_rate: float = 0.02
+    ) -> Dict:
+        """
+        Estimate revenue impact from a precomputed average load time.
+        
+        Business parameters only scale the result, so widget changes can
+        reuse the load time without rescanning the DataFrame.
+        
+        Args:
+            avg_time_seconds: Average load time in seconds
+            monthly_visitors: Monthly visitor count
+            average_order_value: Average order value in currency
+            baseline_conversion_rate: Baseline conversion rate
+            
+        Returns:
+            Dictionary with revenue impact estimates
+        """
+        conversion_impact = BusinessAnalyzer.estimate_conversion_impact_from_load_time(
+            avg_time_seconds, baseline_conversion_rate
+        )
         
         # Calculate revenue
         baseline_conversions = monthly_visitors * baseline_conversion_rate
@@ -128,9 +128,7 @@ class CacheAnalyzer:
         recommendations = []
         
         # Classify resources
-        cache_df['resource_type'] = cache_df['mime_type'].apply(
-            ResourceAnalyzer.classify_resource_type
-        )
+        cache_df['resource_type'] = ResourceAnalyzer.classify_resource_types(cache_df['mime_type'])
         
         # Recommend cache durations by resource type
         cache_durations = {
@@ -167,11 +165,9 @@ class CacheAnalyzer:
         """Get breakdown of cacheable vs non-cacheable resources."""
         from analyzers.resource_analyzer import ResourceAnalyzer
         
-        cache_df['resource_type'] = cache_df['mime_type'].apply(
-            ResourceAnalyzer.classify_resource_type
-        )
+        cache_df['resource_type'] = ResourceAnalyzer.classify_resource_types(cache_df['mime_type'])
         
-        breakdown = cache_df.groupby(['resource_type', 'is_cacheable']).agg({
+        breakdown = cache_df.groupby(['resource_type', 'is_cacheable'], observed=True).agg({
             'url': 'count',
             'response_size': 'sum'
         }).reset_index()
@@ -201,9 +197,7 @@ class CacheAnalyzer:
         
         # Add resource type
         from analyzers.resource_analyzer import ResourceAnalyzer
-        should_cache['resource_type'] = should_cache['mime_type'].apply(
-            ResourceAnalyzer.classify_resource_type
-        )
+        should_cache['resource_type'] = ResourceAnalyzer.classify_resource_types(should_cache['mime_type'])
         
         # Sort by size (largest first)
         should_cache = should_cache.sort_values('response_size', ascending=False)
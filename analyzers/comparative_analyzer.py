@@ -112,15 +112,18 @@ class ComparativeAnalyzer:
             DataFrame with endpoint comparison
         """
         # Get endpoint stats for both
-        endpoints1 = df1.groupby('endpoint')['total_time'].agg(['mean', 'count']).reset_index()
+        endpoints1 = df1.groupby('endpoint', observed=True)['total_time'].agg(['mean', 'count']).reset_index()
         endpoints1.columns = ['endpoint', 'avg_time_before', 'count_before']
         
-        endpoints2 = df2.groupby('endpoint')['total_time'].agg(['mean', 'count']).reset_index()
+        endpoints2 = df2.groupby('endpoint', observed=True)['total_time'].agg(['mean', 'count']).reset_index()
         endpoints2.columns = ['endpoint', 'avg_time_after', 'count_after']
         
         # Merge
         comparison = pd.merge(endpoints1, endpoints2, on='endpoint', how='outer')
-        comparison = comparison.fillna(0)
+        
+        # Only the stat columns can be missing; endpoint may be categorical
+        stat_columns = ['avg_time_before', 'count_before', 'avg_time_after', 'count_after']
+        comparison[stat_columns] = comparison[stat_columns].fillna(0)
         
         # Calculate delta
         comparison['time_delta'] = comparison['avg_time_after'] - comparison['avg_time_before']
@@ -1,12 +1,36 @@
 # analyzers/connection_analyzer.py - Network connection analysis
 
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 class ConnectionAnalyzer:
     """Analyzes network connection patterns and efficiency."""
     
+    @staticmethod
+    def has_connection_timings(df: pd.DataFrame) -> bool:
+        """
+        Check whether the HAR recorded any connection setup timings.
+        
+        The parser stores missing and not-applicable (-1) connect/ssl
+        timings alike as 0, so the values cannot tell a capture without
+        connection timings from one where every connection was reused. The
+        parser's connection_recorded flag keeps that distinction; frames
+        without the flag are only rejected when empty.
+        
+        Args:
+            df: DataFrame with HAR entries
+            
+        Returns:
+            True if connection analysis is meaningful for this HAR
+        """
+        if df.empty or 'connect' not in df.columns:
+            return False
+        
+        if 'connection_recorded' in df.columns:
+            return bool(df['connection_recorded'].any())
+        return True
+    
     @staticmethod
     def analyze_connections(df: pd.DataFrame) -> Dict:
         """
@@ -63,19 +87,21 @@ class ConnectionAnalyzer:
         }
     
     @staticmethod
-    def identify_connection_opportunities(df: pd.DataFrame) -> List[Dict]:
+    def identify_connection_opportunities(df: pd.DataFrame, analysis: Optional[Dict] = None) -> List[Dict]:
         """
         Identify connection pooling and optimization opportunities.
         
         Args:
             df: DataFrame with HAR entries
+            analysis: Result of analyze_connections, computed if not given
             
         Returns:
             List of optimization opportunities
         """
         opportunities = []
         
-        analysis = ConnectionAnalyzer.analyze_connections(df)
+        if analysis is None:
+            analysis = ConnectionAnalyzer.analyze_connections(df)
         
         if not analysis['analysis_available']:
             return opportunities
@@ -146,8 +172,9 @@ class ConnectionAnalyzer:
         if df.empty:
             return pd.DataFrame()
         
-        # Extract domain
-        df['domain'] = df['url'].apply(lambda x: urlparse(x).netloc)
+        # Extract domain if not already present
+        if 'domain' not in df.columns:
+            df = df.assign(domain=df['url'].apply(lambda x: urlparse(x).netloc))
         
         # Group by domain
         breakdown = df.groupby('domain').agg({
@@ -23,9 +23,10 @@ class DomainAnalyzer:
         if df.empty:
             return pd.DataFrame()
         
-        # Extract domain from URL if not already present
+        # Extract domain from URL if not already present. The column is added
+        # to a new frame; the caller's frame may be shared with other threads.
         if 'domain' not in df.columns:
-            df['domain'] = df['url'].apply(lambda x: urlparse(x).netloc)
+            df = df.assign(domain=df['url'].apply(lambda x: urlparse(x).netloc))
         
         # Group by domain and calculate statistics
         domain_stats = df.groupby('domain').agg({
@@ -89,7 +90,7 @@ class DomainAnalyzer:
         
         # Extract domains
         if 'domain' not in df.columns:
-            df['domain'] = df['url'].apply(lambda x: urlparse(x).netloc)
+            df = df.assign(domain=df['url'].apply(lambda x: urlparse(x).netloc))
         
         # Auto-detect main domain if not provided
         if main_domain is None:
@@ -161,7 +162,7 @@ class DomainAnalyzer:
         
         # Extract domains
         if 'domain' not in df.columns:
-            df['domain'] = df['url'].apply(lambda x: urlparse(x).netloc)
+            df = df.assign(domain=df['url'].apply(lambda x: urlparse(x).netloc))
         
         detected_cdns = []
         
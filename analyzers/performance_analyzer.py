@@ -1,5 +1,6 @@
 # analyzers/performance_analyzer.py - Performance analysis
 
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Any, Union, Optional
 from config import (
@@ -115,17 +116,37 @@ class PerformanceAnalyzer:
     
     @staticmethod
     def get_slowest_endpoints(df: pd.DataFrame, limit: int = 10) -> pd.DataFrame:
-        """Get the slowest endpoints."""
-        endpoint_stats = df.groupby('endpoint').agg({
-            'total_time': ['mean', 'count']
-        }).round(2)
-        
-        endpoint_stats.columns = ['avg_response_time', 'request_count']
-        endpoint_stats = endpoint_stats.reset_index()
-        endpoint_stats = endpoint_stats[endpoint_stats['request_count'] >= 1]
+        """
+        Get the slowest endpoints.
+        
+        Per-endpoint counts and sums come from np.bincount over the
+        factorized endpoint codes, one contiguous pass instead of a groupby.
+        A categorical endpoint column already carries its codes, so it is
+        not re-factorized.
+        """
+        endpoint_column = df['endpoint']
+        if isinstance(endpoint_column.dtype, pd.CategoricalDtype):
+            codes = endpoint_column.cat.codes.to_numpy()
+            endpoints = endpoint_column.cat.categories
+        else:
+            codes, endpoints = pd.factorize(endpoint_column, sort=True)
+        valid = codes >= 0
+        codes = codes[valid]
+        
+        counts = np.bincount(codes, minlength=len(endpoints))
+        sums = np.bincount(codes, weights=df['total_time'].to_numpy()[valid], minlength=len(endpoints))
+        seen = counts > 0
+        
+        endpoint_stats = pd.DataFrame({
+            'endpoint': np.asarray(endpoints)[seen],
+            'avg_response_time': sums[seen] / counts[seen],
+            'request_count': counts[seen],
+        })
+        
+        # Round only the rows that are returned, not every endpoint
         endpoint_stats = endpoint_stats.sort_values(
             'avg_response_time', 
             ascending=False
-        ).head(limit)
+        ).head(limit).round({'avg_response_time': 2})
         
         return endpoint_stats
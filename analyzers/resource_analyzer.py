@@ -1,5 +1,6 @@
 # analyzers/resource_analyzer.py - Resource size and optimization analysis
 
+import numpy as np
 import pandas as pd
 from typing import Dict, List
 import re
@@ -49,6 +50,33 @@ class ResourceAnalyzer:
         
         return 'Other'
     
+    @staticmethod
+    def classify_resource_types(mime_types: pd.Series) -> pd.Series:
+        """
+        Classify a column of MIME types.
+        
+        Each distinct MIME type is classified once and the result is
+        categorical, so grouping and comparisons work on integer codes.
+        
+        Args:
+            mime_types: Series of MIME type strings
+            
+        Returns:
+            Categorical Series of resource type categories
+        """
+        # A slice of a categorical column (e.g. the waterfall's first rows)
+        # keeps every category of the full frame; only classify those present
+        mime_categories = mime_types.astype('category').cat.remove_unused_categories()
+        
+        # Trailing 'Other' is picked up by the -1 code of missing values
+        labels = np.array(
+            [ResourceAnalyzer.classify_resource_type(m) for m in mime_categories.cat.categories] + ['Other'],
+            dtype=object
+        )
+        resource_types = labels[mime_categories.cat.codes.to_numpy()]
+        
+        return pd.Series(pd.Categorical(resource_types), index=mime_types.index)
+    
     @staticmethod
     def analyze_by_resource_type(df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -63,13 +91,13 @@ class ResourceAnalyzer:
         if df.empty:
             return pd.DataFrame()
         
-        # Classify resources
-        df['resource_type'] = df['mime_type'].apply(
-            ResourceAnalyzer.classify_resource_type
-        )
+        # Classify resources if not already done. The column is added to a new
+        # frame; the caller's frame may be shared with other threads.
+        if 'resource_type' not in df.columns:
+            df = df.assign(resource_type=ResourceAnalyzer.classify_resource_types(df['mime_type']))
         
         # Group by resource type
-        resource_stats = df.groupby('resource_type').agg({
+        resource_stats = df.groupby('resource_type', observed=True).agg({
             'url': 'count',
             'response_size': ['sum', 'mean', 'max'],
             'total_time': ['mean', 'max']
@@ -119,21 +147,21 @@ class ResourceAnalyzer:
         if threshold is None:
             threshold = ResourceAnalyzer.LARGE_RESOURCE_THRESHOLD
         
-        # Filter large resources
-        large_df = df[df['response_size'] > threshold].copy()
+        # Filter large resources with a plain array mask, taking only the needed columns
+        sizes = df['response_size'].to_numpy()
+        large_df = df.loc[sizes > threshold, ['url', 'mime_type', 'response_size', 'total_time']]
         
         if large_df.empty:
             return pd.DataFrame()
         
         # Add resource type
-        large_df['resource_type'] = large_df['mime_type'].apply(
-            ResourceAnalyzer.classify_resource_type
-        )
+        large_df['resource_type'] = ResourceAnalyzer.classify_resource_types(large_df['mime_type'])
         
         # Add size category
-        large_df['size_category'] = large_df['response_size'].apply(
-            lambda x: 'Very Large (>500KB)' if x > ResourceAnalyzer.VERY_LARGE_THRESHOLD
-            else 'Large (100-500KB)'
+        large_df['size_category'] = np.where(
+            large_df['response_size'].to_numpy() > ResourceAnalyzer.VERY_LARGE_THRESHOLD,
+            'Very Large (>500KB)',
+            'Large (100-500KB)'
         )
         
         # Sort by size
@@ -169,9 +197,8 @@ class ResourceAnalyzer:
         # Identify compressible resource types
         compressible_types = ['JavaScript', 'CSS', 'HTML', 'JSON', 'XML']
         
-        df['resource_type'] = df['mime_type'].apply(
-            ResourceAnalyzer.classify_resource_type
-        )
+        if 'resource_type' not in df.columns:
+            df = df.assign(resource_type=ResourceAnalyzer.classify_resource_types(df['mime_type']))
         
         total_size = df['response_size'].sum()
         compressible_df = df[df['resource_type'].isin(compressible_types)]
@@ -239,9 +266,7 @@ class ResourceAnalyzer:
         
         # Prepare data points for visualization
         data_points = df[['response_size', 'total_time', 'mime_type']].copy()
-        data_points['resource_type'] = data_points['mime_type'].apply(
-            ResourceAnalyzer.classify_resource_type
-        )
+        data_points['resource_type'] = ResourceAnalyzer.classify_resource_types(data_points['mime_type'])
         
         return {
             'correlation': round(correlation, 3),
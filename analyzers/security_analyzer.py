@@ -153,7 +153,8 @@ class SecurityAnalyzer:
         if df.empty:
             return {'high_risk_count': 0, 'domains': []}
         
-        df['domain'] = df['url'].apply(lambda x: urlparse(x).netloc)
+        if 'domain' not in df.columns:
+            df = df.assign(domain=df['url'].apply(lambda x: urlparse(x).netloc))
         main_domain = df['domain'].value_counts().index[0] if not df.empty else ''
         
         # Identify third-party domains
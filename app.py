@@ -13,7 +13,8 @@ from analyzers.performance_analyzer import PerformanceAnalyzer
 from analyzers.performance_benchmarking import PerformanceBenchmarking
 from ui.metrics import MetricsDisplay
 from ui.tabs import TabManager
-from utils.validators import validate_file_size, validate_har_content
+from ui.session_views import SessionViews
+from utils.validators import MAX_FILE_SIZE, validate_file_size, validate_har_content
 from visualizations.charts import ChartFactory
 from exceptions import HARParseError, HARValidationError, HARFileError
 
@@ -63,6 +64,24 @@ def calculate_performance_score(df_hash: str, df):
     return PerformanceBenchmarking.calculate_performance_score(df)
 
 
+@st.cache_data(show_spinner=False)
+def create_performance_gauge(score: int, grade: str):
+    """
+    Build the performance score gauge with caching.
+    
+    The figure only depends on the score and grade, so reruns reuse it
+    instead of rebuilding and validating the plotly indicator.
+    
+    Args:
+        score: Performance score (0-100)
+        grade: Letter grade for the score
+        
+    Returns:
+        Tuple of (gauge figure, chart key)
+    """
+    return ChartFactory.create_performance_score_gauge(score, grade, key="performance_score_gauge")
+
+
 def show_error_with_solutions(error_message: str, solutions: list) -> None:
     """
     Display error message with actionable solutions.
@@ -152,14 +171,14 @@ def main():
         file_size = uploaded_file.size
         is_valid, error = validate_file_size(file_size)
         if not is_valid:
-            show_file_size_error(file_size, 50 * 1024 * 1024)  # 50MB max size
+            show_file_size_error(file_size, MAX_FILE_SIZE)
             st.stop()
         
-        # Read and parse the HAR file
-        har_content = uploaded_file.read().decode('utf-8')
+        # Read the HAR file; content is validated before the bytes are decoded
+        har_bytes = uploaded_file.read()
         
         # Validate content
-        is_valid, error = validate_har_content(har_content)
+        is_valid, error = validate_har_content(har_bytes)
         if not is_valid:
             solutions = [
                 "Ensure you're uploading a valid HAR file (not another file type)",
@@ -170,8 +189,10 @@ def main():
             show_error_with_solutions(error, solutions)
             st.stop()
         
+        har_content = har_bytes.decode('utf-8')
+        
         # Generate hash for caching
-        file_hash = hashlib.md5(har_content.encode()).hexdigest()
+        file_hash = hashlib.md5(har_bytes).hexdigest()
         
         with st.spinner('Parsing HAR file...'):
             df, error = parse_har_file(har_content, file_hash)
@@ -233,7 +254,10 @@ def main():
             
             # Calculate performance score (cached)
             perf_score = calculate_performance_score(df_hash, df)
-            
+
+            # Build per-HAR derived views once; reruns reuse them
+            SessionViews.prepare(df, file_hash)
+
             # Main metrics with performance score
             st.header("📊 Overview Metrics")
             
@@ -241,11 +265,7 @@ def main():
             col1, col2 = st.columns([1, 3])
             
             with col1:
-                fig_gauge, key_gauge = ChartFactory.create_performance_score_gauge(
-                    perf_score['score'],
-                    perf_score['grade'],
-                    key="performance_score_gauge"
-                )
+                fig_gauge, key_gauge = create_performance_gauge(perf_score['score'], perf_score['grade'])
                 if fig_gauge:
                     st.plotly_chart(fig_gauge, use_container_width=True, key=key_gauge)
                 
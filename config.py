@@ -9,6 +9,18 @@ DNS_DELAY_THRESHOLD_MS = 100
 # Chart settings
 RESPONSE_TIME_HISTOGRAM_BINS = 50
 TOP_ENDPOINTS_LIMIT = 10
+SCATTER_MAX_POINTS = 5000
+SCATTER_MIN_POINTS_PER_TYPE = 50
+WATERFALL_WEBGL_MIN_BARS = 1000
+
+# Columns shown in request tables
+REQUEST_DISPLAY_COLUMNS = ['method', 'endpoint', 'status', 'total_time', 'problems']
+
+# Response time percentiles reported in advanced statistics
+RESPONSE_TIME_PERCENTILES = [0.5, 0.75, 0.9, 0.95, 0.99]
+
+# Columns shown in the endpoint summary table
+ENDPOINT_DISPLAY_COLUMNS = ['endpoint', 'request_count', 'avg_response_time']
 
 # Timing phases
 TIMING_PHASES = ['blocked', 'dns', 'connect', 'send', 'wait', 'receive', 'ssl']
@@ -5,6 +5,7 @@ import json
 from datetime import datetime
 from typing import Dict, Optional
 import io
+from utils.display import widen_float32
 
 
 class ReportGenerator:
@@ -71,7 +72,7 @@ class ReportGenerator:
             report['analysis'] = analysis_results
         
         # Add request details
-        report['requests'] = df.to_dict('records')
+        report['requests'] = widen_float32(df).to_dict('records')
         
         return json.dumps(report, indent=2, default=str)
     
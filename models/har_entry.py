@@ -15,6 +15,9 @@ class HARTiming:
     wait: float = 0.0
     receive: float = 0.0
     ssl: float = 0.0
+    # Whether the HAR reported connect/ssl at all; -1 (not applicable,
+    # e.g. a reused connection) counts as reported
+    connection_recorded: bool = False
     
     @property
     def total(self) -> float:
@@ -57,6 +60,7 @@ class HAREntry:
             'wait': self.timing.wait,
             'receive': self.timing.receive,
             'ssl': self.timing.ssl,
+            'connection_recorded': self.timing.connection_recorded,
             'started_datetime': self.started_datetime,
             'response_size': self.response_size,
             'mime_type': self.mime_type,
@@ -72,7 +72,7 @@ class PerformanceBudgetTracker:
             })
         
         # Check max response time
-        max_response_time = df['total_time'].max()
+        max_response_time = float(df['total_time'].max())
         if max_response_time > self.budget.max_response_time_ms:
             violations.append({
                 'metric': 'Max Response Time',
@@ -125,10 +125,9 @@ class PerformanceBudgetTracker:
         
         violations = []
         
-        # Classify resources
-        df['resource_type'] = df['mime_type'].apply(
-            ResourceAnalyzer.classify_resource_type
-        )
+        # Classify resources if not already done, without modifying the caller's frame
+        if 'resource_type' not in df.columns:
+            df = df.assign(resource_type=ResourceAnalyzer.classify_resource_types(df['mime_type']))
         
         # Check JavaScript size
         js_size_kb = df[df['resource_type'] == 'JavaScript']['response_size'].sum() / 1024
@@ -199,7 +198,7 @@ class PerformanceBudgetTracker:
         
         total_requests = len(df)
         total_size_kb = df['response_size'].sum() / 1024
-        max_response_time = df['total_time'].max()
+        max_response_time = float(df['total_time'].max())
         slow_requests = (df['total_time'] > 1000).sum()
         error_rate = (df['status'] >= 400).mean() * 100
         
@@ -4,6 +4,7 @@ import json
 import pandas as pd
 from urllib.parse import urlparse
 from typing import List, Optional, Tuple, Iterator
+from config import TIMING_PHASES
 from utils.logger import get_logger
 from exceptions import HARParseError, HARValidationError, HARFileError
 
@@ -78,9 +79,11 @@ class HARParser:
             # Check if we should use chunked processing for large files
             if len(entries) > LARGE_FILE_THRESHOLD:
                 logger.info(f"Large HAR file detected ({len(entries)} entries), using chunked processing")
-                return HARParser._parse_large_file(entries)
+                df, error = HARParser._parse_large_file(entries)
             else:
-                return HARParser._parse_standard_file(entries)
+                df, error = HARParser._parse_standard_file(entries)
+            
+            return HARParser._optimize_dtypes(df), error
                 
         except (HARParseError, HARValidationError) as e:
             # Re-raise our custom exceptions
@@ -92,6 +95,37 @@ class HARParser:
             logger.error(error_msg, exc_info=True)
             return None, error_msg
     
+    @staticmethod
+    def _optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Downcast columns to compact dtypes once at load time.
+        
+        Timing values fit in float32, response sizes in int32 (int64 if any
+        response is 2 GiB or larger) and status codes in int16, which halves
+        the memory every later aggregation has to scan. Method, endpoint and
+        MIME type become categoricals so grouping and classification work on
+        integer codes instead of hashing strings per row. Status stays
+        numeric because analyzers compare it against ranges (>= 400). Charts
+        send these compact arrays to Plotly.js as f4/i4 typed arrays rather
+        than f8/i8.
+        
+        Args:
+            df: DataFrame with parsed entries
+            
+        Returns:
+            DataFrame with downcast columns
+        """
+        timing_cols = TIMING_PHASES + ['total_time']
+        df[timing_cols] = df[timing_cols].astype('float32')
+        df['status'] = pd.to_numeric(df['status'], errors='coerce').fillna(0).astype('int16')
+        response_size = pd.to_numeric(df['response_size'], errors='coerce').fillna(0)
+        fits_int32 = response_size.between(-2**31, 2**31 - 1).all()
+        df['response_size'] = response_size.astype('int32' if fits_int32 else 'int64')
+        df['method'] = df['method'].astype('category')
+        df['endpoint'] = df['endpoint'].astype('category')
+        df['mime_type'] = df['mime_type'].astype('category')
+        return df
+    
     @staticmethod
     def _parse_standard_file(entries: List[dict]) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
         """
@@ -259,6 +293,9 @@ class HARParser:
                     wait=safe_time(timings.get('wait')),
                     receive=safe_time(timings.get('receive')),
                     ssl=safe_time(timings.get('ssl')),
+                    connection_recorded=any(
+                        isinstance(timings.get(key), (int, float)) for key in ('connect', 'ssl')
+                    ),
                 )
             except Exception as e:
                 raise HARParseError(f"Failed to parse timing data: {str(e)}")
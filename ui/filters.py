@@ -1,8 +1,9 @@
 # ui/filters.py - Filter components
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from urllib.parse import urlparse
 
 
@@ -65,58 +66,73 @@ class FilterManager:
         search_term: str = None,
         method_filter: str = None,
         status_filter: int = None,
-        preset_filter: str = None
+        preset_filter: str = None,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
-        """Apply filters to the DataFrame."""
-        filtered_df = df.copy()
+        """
+        Apply filters to the DataFrame.
+        
+        All predicates are ANDed in place into one preallocated boolean
+        array, so the DataFrame is indexed once instead of being copied and
+        re-sliced per filter.
+        
+        Args:
+            columns: If given, only these columns are returned; rows and
+                columns are selected in the same take
+        """
+        mask = np.ones(len(df), dtype=bool)
         
         # Apply preset filter first
         if preset_filter:
-            filtered_df = FilterManager._apply_preset_filter(filtered_df, preset_filter)
+            np.logical_and(mask, FilterManager._preset_mask(df, preset_filter).to_numpy(), out=mask)
         
-        # Apply custom filters
+        # Apply custom filters. The endpoint is the URL's host and path, so
+        # matching the URL covers it; regex=False keeps the search literal.
         if search_term:
-            filtered_df = filtered_df[
-                filtered_df['url'].str.contains(search_term, case=False, na=False) |
-                filtered_df['endpoint'].str.contains(search_term, case=False, na=False)
-            ]
+            matches = df['url'].str.contains(search_term, case=False, regex=False, na=False)
+            np.logical_and(mask, matches.to_numpy(dtype=bool), out=mask)
         
         if method_filter and method_filter != 'All':
-            filtered_df = filtered_df[filtered_df['method'] == method_filter]
+            np.logical_and(mask, (df['method'] == method_filter).to_numpy(), out=mask)
         
         if status_filter and status_filter != 'All':
-            filtered_df = filtered_df[filtered_df['status'] == status_filter]
+            np.logical_and(mask, (df['status'] == status_filter).to_numpy(), out=mask)
         
-        return filtered_df
+        rows = np.flatnonzero(mask)
+        if columns is not None:
+            return df.iloc[rows, df.columns.get_indexer(columns)]
+        return df.iloc[rows]
     
     @staticmethod
-    def _apply_preset_filter(df: pd.DataFrame, preset: str) -> pd.DataFrame:
-        """Apply a preset filter to the DataFrame."""
+    def _preset_mask(df: pd.DataFrame, preset: str) -> pd.Series:
+        """Get the boolean mask for a preset filter."""
         if preset == 'slow':
             # Slow requests (>1000ms)
-            return df[df['total_time'] > 1000]
+            return df['total_time'] > 1000
         
         elif preset == 'large':
             # Large resources (>100KB)
-            return df[df['response_size'] > 100 * 1024]
+            return df['response_size'] > 100 * 1024
         
         elif preset == 'errors':
             # Error responses (4xx/5xx)
-            return df[df['status'] >= 400]
+            return df['status'] >= 400
         
         elif preset == 'third_party':
             # Third-party resources (different domain than most common)
-            if 'domain' not in df.columns:
-                df['domain'] = df['url'].apply(lambda x: urlparse(x).netloc)
+            if 'domain' in df.columns:
+                domains = df['domain']
+            else:
+                domains = df['url'].apply(lambda x: urlparse(x).netloc)
             
             # Get main domain (most frequent)
-            main_domain = df['domain'].value_counts().index[0] if not df.empty else ''
+            main_domain = domains.value_counts().index[0] if not df.empty else ''
             
             # Filter for domains not matching main domain
-            return df[~df['domain'].str.contains(main_domain, na=False, regex=False)]
+            return ~domains.str.contains(main_domain, na=False, regex=False)
         
         elif preset == 'blocking':
             # Blocking resources (high wait time >500ms)
-            return df[df['wait'] > 500]
+            return df['wait'] > 500
         
-        return df
+        return pd.Series(True, index=df.index)
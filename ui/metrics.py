@@ -1,44 +1,89 @@
 # ui/metrics.py - Metrics display components
 
+import html
 import streamlit as st
 import pandas as pd
-from analyzers.performance_analyzer import PerformanceAnalyzer
+from typing import Any, Dict, List, Tuple
+from ui.session_views import SessionViews
 
 
 class MetricsDisplay:
     """Handles metrics display in the UI."""
     
+    # Colors used for metric deltas in HTML metric grids
+    DELTA_COLORS = {'good': '#09ab3b', 'bad': '#ff2b2b'}
+    
     @staticmethod
-    def render_overview_metrics(df: pd.DataFrame):
-        """Render main overview metrics."""
-        stats = PerformanceAnalyzer.get_statistics(df)
+    def render_metric_row(metrics: List[Tuple[str, Any]]) -> None:
+        """
+        Render precomputed (label, value) pairs as one row of st.metric.
         
-        col1, col2, col3, col4 = st.columns(4)
+        Args:
+            metrics: List of (label, value) tuples, one column each
+        """
+        for col, (label, value) in zip(st.columns(len(metrics)), metrics):
+            col.metric(label, value)
+    
+    @staticmethod
+    def render_metric_grid(metrics: List[Dict], columns: int = 2) -> None:
+        """
+        Render several metrics as a single HTML block.
         
-        with col1:
-            st.metric("Total Requests", stats['total_requests'])
+        One markdown element replaces a column layout of st.metric widgets,
+        so the browser receives one delta instead of one per metric.
         
-        with col2:
-            st.metric("Unique Endpoints", stats['unique_endpoints'])
+        Args:
+            metrics: List of dicts with 'label', 'value' and optionally
+                'delta' and 'delta_good' (True for green/up, False for red/down)
+            columns: Number of grid columns
+        """
+        def _escape(text) -> str:
+            # '$' would otherwise be read as a LaTeX delimiter by st.markdown
+            return html.escape(str(text)).replace('$', '&#36;')
         
-        with col3:
-            st.metric("Error Rate", f"{stats['error_rate']:.1f}%")
+        cells = []
+        for metric in metrics:
+            delta_html = ''
+            if metric.get('delta'):
+                good = metric.get('delta_good', True)
+                color = MetricsDisplay.DELTA_COLORS['good' if good else 'bad']
+                arrow = '▲' if good else '▼'
+                delta_html = (
+                    f"<div style='color:{color};font-size:0.9rem'>"
+                    f"{arrow} {_escape(metric['delta'])}</div>"
+                )
+            cells.append(
+                "<div>"
+                f"<div style='font-size:0.875rem;opacity:0.8'>{_escape(metric['label'])}</div>"
+                f"<div style='font-size:1.75rem'>{_escape(metric['value'])}</div>"
+                f"{delta_html}</div>"
+            )
         
-        with col4:
-            st.metric("Avg Response Time", f"{stats['avg_response_time']:.0f}ms")
+        st.markdown(
+            f"<div style='display:grid;grid-template-columns:repeat({columns},1fr);"
+            f"gap:1rem;margin-bottom:1rem'>{''.join(cells)}</div>",
+            unsafe_allow_html=True
+        )
+    
+    @staticmethod
+    def render_overview_metrics(df: pd.DataFrame):
+        """Render main overview metrics."""
+        stats = SessionViews.get('statistics', df)
+        
+        MetricsDisplay.render_metric_row([
+            ("Total Requests", stats['total_requests']),
+            ("Unique Endpoints", stats['unique_endpoints']),
+            ("Error Rate", f"{stats['error_rate']:.1f}%"),
+            ("Avg Response Time", f"{stats['avg_response_time']:.0f}ms")
+        ])
     
     @staticmethod
     def render_detailed_statistics(df: pd.DataFrame):
         """Render detailed performance statistics."""
-        stats = PerformanceAnalyzer.get_statistics(df)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("Max Response Time", f"{stats['max_response_time']:.0f}ms")
-        
-        with col2:
-            st.metric("Min Response Time", f"{stats['min_response_time']:.0f}ms")
+        stats = SessionViews.get('statistics', df)
         
-        with col3:
-            st.metric("Problematic Requests", stats['problematic_count'])
+        MetricsDisplay.render_metric_row([
+            ("Max Response Time", f"{stats['max_response_time']:.0f}ms"),
+            ("Min Response Time", f"{stats['min_response_time']:.0f}ms"),
+            ("Problematic Requests", stats['problematic_count'])
+        ])
@@ -0,0 +1,461 @@
+# ui/session_views.py - Per-HAR derived views kept in session state
+
+import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import attrgetter
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, Optional
+from analyzers.performance_analyzer import PerformanceAnalyzer
+from visualizations.charts import ChartFactory
+from config import (
+    TIMING_PHASES,
+    REQUEST_DISPLAY_COLUMNS,
+    ENDPOINT_DISPLAY_COLUMNS,
+    RESPONSE_TIME_PERCENTILES,
+)
+
+
+class SessionViews:
+    """Computes derived views once per HAR file and shares them across reruns."""
+    
+    # Session state key holding the hash of the HAR the views were built from
+    HASH_KEY = 'views_har_hash'
+    
+    # Number of most frequent endpoints shown in the timing tab
+    TOP_TIMING_ENDPOINTS = 20
+    
+    # Number of slowest endpoints listed in the endpoint summary tab
+    ENDPOINT_SUMMARY_LIMIT = 50
+    
+    # Number of slowest problematic requests listed in the problematic tab
+    PROBLEMATIC_DISPLAY_LIMIT = 200
+    
+    # Views built concurrently in worker threads. Their builders must not add
+    # columns to the shared DataFrame (shared derived columns are added by
+    # _add_shared_columns before they start), and must not touch st.* or
+    # other views, which need the script thread.
+    PARALLEL_VIEWS = (
+        'domain_view',
+        'recommendations',
+        'resource_view',
+        'cache_view',
+        'security_view',
+        'budget_view',
+        'waterfall_view',
+        'connection_view',
+        'charts',
+    )
+    
+    # Worker threads used to build PARALLEL_VIEWS
+    MAX_WORKERS = 4
+    
+    @staticmethod
+    def _add_shared_columns(df: pd.DataFrame) -> None:
+        """
+        Add the derived columns several analyzers group by.
+        
+        Runs on the script thread before the worker views start. Analyzers
+        reuse these columns when present and otherwise add them to a new
+        frame, so nothing writes to the shared frame while workers read it.
+        """
+        from urllib.parse import urlparse
+        from analyzers.resource_analyzer import ResourceAnalyzer
+        
+        if 'domain' not in df.columns:
+            df['domain'] = df['url'].apply(lambda x: urlparse(x).netloc)
+        if 'resource_type' not in df.columns:
+            df['resource_type'] = ResourceAnalyzer.classify_resource_types(df['mime_type'])
+    
+    @staticmethod
+    def _drop_unused_categories(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop category levels not present in a display subset.
+        
+        Categorical columns are serialized with their full dictionary, so a
+        50-row table would otherwise ship every endpoint in the HAR.
+        """
+        for column in df.select_dtypes(include='category').columns:
+            df[column] = df[column].cat.remove_unused_categories()
+        return df
+    
+    @staticmethod
+    def compute_statistics(df: pd.DataFrame) -> Dict[str, Any]:
+        """Headline statistics shared by the overview metrics and the timing tab."""
+        return PerformanceAnalyzer.get_statistics(df)
+    
+    @staticmethod
+    def compute_endpoint_timing(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Average timing phases for the most frequent endpoints.
+        
+        Per-endpoint sums come from np.bincount over the endpoint codes, one
+        contiguous pass per phase instead of a pandas groupby.
+        """
+        codes, endpoints = pd.factorize(df['endpoint'], sort=True)
+        valid = codes >= 0
+        codes = codes[valid]
+        n_endpoints = len(endpoints)
+        
+        counts = np.bincount(codes, minlength=n_endpoints)
+        
+        # Most frequent endpoints, kept in sorted endpoint order like a groupby
+        top_codes = np.sort(
+            np.argsort(-counts, kind='stable')[:SessionViews.TOP_TIMING_ENDPOINTS]
+        )
+        top_codes = top_codes[counts[top_codes] > 0]
+        
+        means = np.empty((len(top_codes), len(TIMING_PHASES)))
+        for i, phase in enumerate(TIMING_PHASES):
+            sums = np.bincount(codes, weights=df[phase].to_numpy()[valid], minlength=n_endpoints)
+            means[:, i] = sums[top_codes] / counts[top_codes]
+        
+        index = pd.Index(np.asarray(endpoints)[top_codes], name='endpoint')
+        return pd.DataFrame(means, index=index, columns=TIMING_PHASES).round(2)
+    
+    @staticmethod
+    def compute_total_times(df: pd.DataFrame) -> np.ndarray:
+        """Contiguous NumPy array of total request times, shared by other views."""
+        return np.ascontiguousarray(df['total_time'].to_numpy())
+    
+    @staticmethod
+    def compute_problematic_idx(df: pd.DataFrame) -> np.ndarray:
+        """Row positions of all problematic requests."""
+        return np.flatnonzero(df['is_problematic'].to_numpy(dtype=bool))
+    
+    @staticmethod
+    def compute_problematic_df(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Slowest problematic requests, narrowed to the display columns.
+        
+        Only the top PROBLEMATIC_DISPLAY_LIMIT rows are kept; they are
+        selected with argpartition so just those rows get sorted.
+        """
+        positions = SessionViews.get('problematic_idx', df)
+        neg_times = -SessionViews.get('total_times', df)[positions]
+        
+        limit = SessionViews.PROBLEMATIC_DISPLAY_LIMIT
+        if len(positions) > limit:
+            top = np.argpartition(neg_times, limit)[:limit]
+            order = top[np.argsort(neg_times[top], kind='stable')]
+        else:
+            order = np.argsort(neg_times, kind='stable')
+        
+        problematic_df = (
+            df[REQUEST_DISPLAY_COLUMNS]
+            .iloc[positions[order]]
+            .reset_index(drop=True)
+        )
+        return SessionViews._drop_unused_categories(problematic_df)
+    
+    @staticmethod
+    def compute_endpoint_stats(df: pd.DataFrame) -> pd.DataFrame:
+        """Slowest endpoints, narrowed to the display columns."""
+        endpoint_stats = PerformanceAnalyzer.get_slowest_endpoints(
+            df, limit=SessionViews.ENDPOINT_SUMMARY_LIMIT
+        )[ENDPOINT_DISPLAY_COLUMNS].reset_index(drop=True)
+        return SessionViews._drop_unused_categories(endpoint_stats)
+    
+    # Requests slower than mean + N standard deviations are outliers
+    OUTLIER_STD_THRESHOLD = 3
+    
+    @staticmethod
+    def compute_time_stats(df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Response time percentiles, summary statistics and outlier positions.
+        
+        All statistics are NumPy reductions over the same contiguous buffer;
+        sums accumulate in float64 since timings are stored as float32. The
+        standard deviation comes from the sum and sum of squares, so it needs
+        no second pass over deviations from the mean. Min and max are the 0th
+        and 100th quantiles, taken by the same partition as the percentiles.
+        """
+        total_times = SessionViews.get('total_times', df)
+        
+        quantiles = np.quantile(total_times, [0.0, *RESPONSE_TIME_PERCENTILES, 1.0])
+        
+        n = total_times.size
+        total = total_times.sum(dtype=np.float64)
+        sum_squares = np.einsum('i,i->', total_times, total_times, dtype=np.float64)
+        mean = total / n
+        std = np.sqrt(max(sum_squares - n * mean * mean, 0.0) / (n - 1)) if n > 1 else np.nan
+        summary = pd.Series({
+            'mean': mean,
+            'std': std,
+            'min': float(quantiles[0]),
+            'max': float(quantiles[-1]),
+        })
+        
+        # Reuse the summary mean/std so outliers cost a single comparison pass
+        threshold = mean + SessionViews.OUTLIER_STD_THRESHOLD * std
+        outlier_idx = np.flatnonzero(total_times > threshold)
+        outliers_df = SessionViews._drop_unused_categories(
+            df[['endpoint', 'total_time', 'status']].iloc[outlier_idx].reset_index(drop=True)
+        )
+        
+        return {
+            'percentiles': pd.Series(quantiles[1:-1], index=RESPONSE_TIME_PERCENTILES),
+            'summary': summary,
+            'outlier_threshold': threshold,
+            'outlier_idx': outlier_idx,
+            'outliers_df': outliers_df,
+        }
+    
+    @staticmethod
+    def compute_charts(df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Figures that depend only on the DataFrame.
+        
+        Plotly validates every trace on construction, so figures are built
+        once per HAR file and reused across reruns and tabs; the tabs pass
+        their own widget keys when rendering.
+        """
+        # Aggregates shared by the summary charts, computed once
+        inputs = ChartFactory.precompute_chart_inputs(df)
+        
+        return {
+            'response_time_histogram': ChartFactory.create_response_time_histogram(df)[0],
+            'status_code': ChartFactory.create_status_code_chart(df, inputs=inputs)[0],
+            'timing_breakdown': ChartFactory.create_timing_breakdown_chart(df, inputs=inputs)[0],
+            'slowest_endpoints': ChartFactory.create_slowest_endpoints_chart(df, inputs=inputs)[0],
+            'slowest_endpoints_top20': ChartFactory.create_slowest_endpoints_chart(df, limit=20, inputs=inputs)[0],
+            'size_vs_time': ChartFactory.create_size_vs_time_scatter(df)[0],
+            'percentile': ChartFactory.create_percentile_chart(df, inputs=inputs)[0],
+        }
+    
+    @staticmethod
+    def compute_domain_view(df: pd.DataFrame) -> Dict[str, Any]:
+        """Domain statistics and chart, third-party breakdown and CDN usage."""
+        from analyzers.domain_analyzer import DomainAnalyzer
+        
+        domain_stats = DomainAnalyzer.analyze_by_domain(df)
+        if domain_stats.empty:
+            return {'domain_stats': domain_stats}
+        
+        return {
+            'domain_stats': domain_stats,
+            'domain_chart': ChartFactory.create_domain_performance_chart(domain_stats)[0],
+            'third_party': DomainAnalyzer.identify_third_party_domains(df),
+            'cdn_usage': DomainAnalyzer.detect_cdn_usage(df),
+        }
+    
+    # Recommendation priorities in display order
+    RECOMMENDATION_PRIORITIES = ('High', 'Medium', 'Low')
+    
+    @staticmethod
+    def compute_recommendations(df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Performance recommendations grouped by priority.
+        
+        Grouping happens here, once per HAR file, so the recommendations
+        tab renders each bucket without re-scanning the full list.
+        """
+        from analyzers.recommendation_engine import RecommendationEngine
+        
+        recommendations = RecommendationEngine.generate_recommendations(df)
+        
+        # The engine returns recommendations sorted by priority, so each
+        # priority is one contiguous run
+        by_priority = {priority: [] for priority in SessionViews.RECOMMENDATION_PRIORITIES}
+        for priority, group in groupby(recommendations, key=attrgetter('priority')):
+            if priority in by_priority:
+                by_priority[priority].extend(group)
+        
+        return {'total': len(recommendations), 'by_priority': by_priority}
+    
+    @staticmethod
+    def compute_resource_view(df: pd.DataFrame) -> Dict[str, Any]:
+        """Resource type statistics and chart, large resources and compression savings."""
+        from analyzers.resource_analyzer import ResourceAnalyzer
+        
+        resource_stats = ResourceAnalyzer.analyze_by_resource_type(df)
+        if resource_stats.empty:
+            return {'resource_stats': resource_stats}
+        
+        # Both totals from one reduction over the two columns
+        totals = resource_stats[['total_size', 'count']].sum()
+        total_size = float(totals['total_size'])
+        total_count = int(totals['count'])
+        
+        return {
+            'resource_stats': resource_stats,
+            'resource_chart': ChartFactory.create_resource_size_chart(resource_stats)[0],
+            'total_size': total_size,
+            'total_count': total_count,
+            'avg_size': total_size / total_count if total_count > 0 else 0.0,
+            'large_resources': ResourceAnalyzer.identify_large_resources(df),
+            'compression': ResourceAnalyzer.analyze_compression_opportunities(df),
+        }
+    
+    @staticmethod
+    def compute_cache_view(df: pd.DataFrame) -> Dict[str, Any]:
+        """Caching opportunities, repeat visit savings and uncached resources."""
+        from analyzers.cache_analyzer import CacheAnalyzer
+        
+        return {
+            'analysis': CacheAnalyzer.analyze_caching_opportunities(df),
+            'repeat_savings': CacheAnalyzer.calculate_repeat_visit_savings(df),
+            'non_cacheable': CacheAnalyzer.get_non_cacheable_resources(df),
+        }
+    
+    @staticmethod
+    def compute_security_view(df: pd.DataFrame) -> Dict[str, Any]:
+        """Security analysis, HTTP/HTTPS protocol breakdown and its chart."""
+        from analyzers.security_analyzer import SecurityAnalyzer
+        protocol_breakdown = SecurityAnalyzer.get_protocol_breakdown(df)
+        protocol_chart, _ = ChartFactory.create_protocol_chart(
+            protocol_breakdown['https_count'], protocol_breakdown['http_count']
+        )
+        
+        return {
+            'security': SecurityAnalyzer.analyze_security(df),
+            'protocol_breakdown': protocol_breakdown,
+            'protocol_chart': protocol_chart,
+        }
+    
+    @staticmethod
+    def compute_budget_view(df: pd.DataFrame) -> Dict[str, Any]:
+        """Budget check and utilization chart against the default performance budget."""
+        from models.performance_budget import PerformanceBudgetTracker
+        
+        budget_tracker = PerformanceBudgetTracker()
+        utilization = budget_tracker.get_budget_utilization(df)
+        utilization_chart, _ = ChartFactory.create_budget_utilization_chart(utilization)
+        
+        return {
+            'check': budget_tracker.check_budget(df),
+            'utilization_chart': utilization_chart,
+        }
+    
+    @staticmethod
+    def compute_waterfall_view(df: pd.DataFrame) -> Dict[str, Any]:
+        """Request parallelism patterns and the critical path."""
+        from visualizations.waterfall import WaterfallChart
+        
+        return {
+            'patterns': WaterfallChart.analyze_request_patterns(df),
+            'critical_path': WaterfallChart.identify_critical_path(df),
+        }
+    
+    @staticmethod
+    def compute_business_inputs(df: pd.DataFrame) -> Dict[str, Any]:
+        """DataFrame-dependent inputs of the business impact tab."""
+        from analyzers.business_analyzer import BusinessAnalyzer
+        
+        return {
+            'ux_score': BusinessAnalyzer.calculate_user_experience_score(df),
+            'avg_load_time_seconds': BusinessAnalyzer.get_avg_load_time_seconds(df),
+        }
+    
+    @staticmethod
+    def compute_has_connection_timings(df: pd.DataFrame) -> bool:
+        """Whether the HAR contains connection setup timings."""
+        from analyzers.connection_analyzer import ConnectionAnalyzer
+        
+        return ConnectionAnalyzer.has_connection_timings(df)
+    
+    @staticmethod
+    def compute_connection_view(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """Connection analysis and a display-ready opportunities table."""
+        from analyzers.connection_analyzer import ConnectionAnalyzer
+        
+        if not ConnectionAnalyzer.has_connection_timings(df):
+            return None
+        
+        analysis = ConnectionAnalyzer.analyze_connections(df)
+        opportunities = ConnectionAnalyzer.identify_connection_opportunities(df, analysis)
+        
+        opportunities_df = pd.DataFrame(opportunities, columns=[
+            'priority', 'title', 'category', 'description', 'impact', 'current_value', 'target_value'
+        ])
+        opportunities_df['priority'] = opportunities_df['priority'].map(
+            lambda p: f"{'🔴' if p == 'High' else '🟡'} {p}"
+        )
+        
+        return {
+            'analysis': analysis,
+            'opportunities_df': opportunities_df,
+            'breakdown': ConnectionAnalyzer.get_connection_breakdown(df),
+        }
+    
+    @staticmethod
+    def _builders() -> Dict[str, Callable[[pd.DataFrame], Any]]:
+        """Map of session state keys to the functions that build them."""
+        return {
+            'statistics': SessionViews.compute_statistics,
+            'endpoint_timing': SessionViews.compute_endpoint_timing,
+            'total_times': SessionViews.compute_total_times,
+            'problematic_idx': SessionViews.compute_problematic_idx,
+            'problematic_df': SessionViews.compute_problematic_df,
+            'endpoint_stats': SessionViews.compute_endpoint_stats,
+            'has_connection_timings': SessionViews.compute_has_connection_timings,
+            'time_stats': SessionViews.compute_time_stats,
+            'domain_view': SessionViews.compute_domain_view,
+            'recommendations': SessionViews.compute_recommendations,
+            'resource_view': SessionViews.compute_resource_view,
+            'cache_view': SessionViews.compute_cache_view,
+            'security_view': SessionViews.compute_security_view,
+            'budget_view': SessionViews.compute_budget_view,
+            'waterfall_view': SessionViews.compute_waterfall_view,
+            'connection_view': SessionViews.compute_connection_view,
+            'business_inputs': SessionViews.compute_business_inputs,
+            'charts': SessionViews.compute_charts,
+        }
+    
+    @staticmethod
+    def prepare(df: pd.DataFrame, har_hash: str) -> None:
+        """
+        Build all derived views for a newly loaded HAR file.
+        
+        Views are only rebuilt when the HAR hash changes, so widget
+        interactions reuse the stored results. Independent analyzer views
+        are built in a thread pool while the remaining views are built in
+        order on the script thread; NumPy and pandas release the GIL in
+        their inner loops, so the scans overlap. Shared derived columns are
+        added to df first, so no builder adds columns while others read it.
+        
+        Args:
+            df: Analyzed DataFrame with HAR entries
+            har_hash: Hash of the HAR file content
+        """
+        if st.session_state.get(SessionViews.HASH_KEY) == har_hash:
+            return
+        
+        SessionViews._add_shared_columns(df)
+        builders = SessionViews._builders()
+        
+        with ThreadPoolExecutor(max_workers=SessionViews.MAX_WORKERS) as executor:
+            futures = {
+                name: executor.submit(builders[name], df)
+                for name in SessionViews.PARALLEL_VIEWS
+            }
+            
+            # Sequential builders run in declaration order, so later views can read earlier ones
+            for name, builder in builders.items():
+                if name not in futures:
+                    st.session_state[name] = builder(df)
+            
+            # Session state is only written from the script thread
+            for name, future in futures.items():
+                st.session_state[name] = future.result()
+        
+        st.session_state[SessionViews.HASH_KEY] = har_hash
+    
+    @staticmethod
+    def get(name: str, df: pd.DataFrame) -> Any:
+        """
+        Get a derived view, computing it if it has not been prepared.
+        
+        Args:
+            name: View name
+            df: DataFrame the view is derived from
+        
+        Returns:
+            The stored or freshly computed view
+        """
+        # Test for the key, not for None: some views (e.g. connection_view)
+        # are legitimately None once prepared
+        if name in st.session_state:
+            return st.session_state[name]
+        return SessionViews._builders()[name](df)
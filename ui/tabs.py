@@ -2,38 +2,194 @@
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-from typing import Tuple, Dict, Any, List, Optional, Union
-from visualizations.charts import ChartFactory
+from typing import Optional, Tuple
+from visualizations.waterfall import WaterfallChart
+from analyzers.business_analyzer import BusinessAnalyzer
+from analyzers.comparative_analyzer import ComparativeAnalyzer
+from parsers.har_parser import HARParser
 from ui.filters import FilterManager
 from ui.metrics import MetricsDisplay
-from analyzers.performance_analyzer import PerformanceAnalyzer
+from ui.session_views import SessionViews
+from utils.display import widen_float32
+from config import REQUEST_DISPLAY_COLUMNS
+
+
+# Static reference content, sent to the browser only when toggled on
+COMPARATIVE_USE_CASES_MD = """
+**Comparative analysis is useful for:**
+
+1. **Before/After Optimization**
+   - Compare performance before and after implementing optimizations
+   - Measure impact of code changes
+
+2. **A/B Testing**
+   - Compare different versions of your application
+   - Validate performance improvements
+
+3. **Regression Detection**
+   - Identify performance degradations
+   - Track performance over time
+
+4. **Environment Comparison**
+   - Compare production vs staging performance
+   - Compare different deployment configurations
+
+5. **Feature Impact Analysis**
+   - Measure performance impact of new features
+   - Identify bottlenecks introduced by changes
+"""
+
+CONNECTION_BEST_PRACTICES_MD = """
+**Connection Reuse Best Practices:**
+
+1. **Enable HTTP Keep-Alive**
+   - Allows multiple requests over a single connection
+   - Target: >80% connection reuse ratio
+
+2. **Use Connection Pooling**
+   - Reuse connections across requests
+   - Reduces connection setup overhead
+
+3. **Optimize SSL/TLS**
+   - Enable TLS session resumption
+   - Use OCSP stapling
+   - Target: <50ms SSL handshake time
+
+4. **Consider HTTP/2 or HTTP/3**
+   - Multiplexing reduces connection overhead
+   - Single connection for multiple requests
+   - Eliminates head-of-line blocking (HTTP/3)
+
+5. **Use CDN**
+   - Reduces geographic latency
+   - Improves connection times
+   - Target: <50ms connection time
+
+6. **Minimize New Connections**
+   - Consolidate resources from same domain
+   - Reduce number of third-party domains
+   - Target: <20% new connections
+"""
+
+BUSINESS_BENCHMARKS_MD = """
+**Performance Impact on Business Metrics:**
+
+1. **Load Time Impact**
+   - 1 second delay = 7% reduction in conversions
+   - 100ms delay = 1% drop in sales (Amazon)
+   - 2 second delay = 87% bounce rate increase
+
+2. **Abandonment Rates by Load Time**
+   - 1 second: 7% abandon
+   - 2 seconds: 11% abandon
+   - 3 seconds: 16% abandon
+   - 5 seconds: 32% abandon
+   - 10 seconds: 53% abandon
+
+3. **Mobile Impact**
+   - 53% of mobile users abandon sites taking >3s to load
+   - Mobile conversion rates are 2x lower with 5s load time
+
+4. **Revenue Correlation**
+   - Every 100ms improvement = 1% revenue increase (Walmart)
+   - 0.1s improvement = 8% conversion increase (Mobify)
+
+**Sources:** Google, Amazon, Akamai, Kissmetrics research
+"""
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def filtered_requests_csv(har_hash: str, filter_key: tuple, _filtered_df: pd.DataFrame) -> bytes:
+    """
+    Encode filtered requests as CSV with caching based on HAR hash and filters.
+    
+    Each filter combination stores a full CSV, so the cache is bounded in
+    entries and age to keep it from growing across sessions.
+    
+    Args:
+        har_hash: Hash of the HAR file content for cache key
+        filter_key: Filter values that produced the rows, for cache key
+        _filtered_df: Filtered requests (not hashed)
+        
+    Returns:
+        CSV content as bytes
+    """
+    return _filtered_df.to_csv(index=False).encode('utf-8')
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def waterfall_figure(har_hash: str, detailed: bool, max_requests: int, _df: pd.DataFrame) -> Tuple[Optional[go.Figure], Optional[str]]:
+    """
+    Build a waterfall chart with caching based on HAR hash and chart options.
+    
+    The figure object itself is cached, so switching back to a chart type
+    or request limit that was already shown skips rebuilding it.
+    
+    Args:
+        har_hash: Hash of the HAR file content for cache key
+        detailed: Whether to show timing phases instead of total times
+        max_requests: Maximum number of requests to display
+        _df: DataFrame with HAR entries (not hashed)
+        
+    Returns:
+        Tuple of (Plotly figure, chart key)
+    """
+    if detailed:
+        return WaterfallChart.create_waterfall(_df, max_requests=max_requests)
+    return WaterfallChart.create_simplified_waterfall(_df, max_requests=max_requests)
 
 
 class TabManager:
-    """Manages tab content and layouts."""
+    """
+    Manages tab content and layouts.
+    
+    Each tab renderer is an st.fragment, so interacting with a widget
+    reruns only the tab that owns it instead of every tab on the page.
+    """
+    
+    # Icons shown next to security issue and budget violation severities
+    SEVERITY_ICONS = {'High': '🔴', 'Medium': '🟡', 'Low': '🟢'}
+    
+    # Number of rows sent to the browser per page of the requests table
+    REQUESTS_PAGE_SIZE = 200
+    
+    @staticmethod
+    def _render_reference_section(title: str, content: str, key: str) -> None:
+        """
+        Render static reference markdown behind a toggle.
+        
+        Expander bodies are sent even while collapsed; a toggle keeps the
+        text out of the page until the user asks for it.
+        
+        Args:
+            title: Toggle label
+            content: Markdown to show when toggled on
+            key: Widget key for the toggle
+        """
+        if st.toggle(title, key=key):
+            st.markdown(content)
     
     @staticmethod
+    @st.fragment
     def render_overview_tab(df: pd.DataFrame) -> None:
         """Render the Overview tab."""
         st.subheader("Performance Overview")
         
+        # Figures are built once per HAR file
+        charts = SessionViews.get('charts', df)
+        
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_hist, key_hist = ChartFactory.create_response_time_histogram(df, key="overview_histogram")
-            st.plotly_chart(fig_hist, use_container_width=True, key=key_hist)
-            
-            fig_status, key_status = ChartFactory.create_status_code_chart(df, key="overview_status")
-            st.plotly_chart(fig_status, use_container_width=True, key=key_status)
+            st.plotly_chart(charts['response_time_histogram'], use_container_width=True, key="overview_histogram")
+            st.plotly_chart(charts['status_code'], use_container_width=True, key="overview_status")
         
         with col2:
-            fig_timing, key_timing = ChartFactory.create_timing_breakdown_chart(df, key="overview_timing")
-            st.plotly_chart(fig_timing, use_container_width=True, key=key_timing)
-            
-            fig_endpoints, key_endpoints = ChartFactory.create_slowest_endpoints_chart(df, key="overview_endpoints")
-            st.plotly_chart(fig_endpoints, use_container_width=True, key=key_endpoints)
+            st.plotly_chart(charts['timing_breakdown'], use_container_width=True, key="overview_timing")
+            st.plotly_chart(charts['slowest_endpoints'], use_container_width=True, key="overview_endpoints")
     
     @staticmethod
+    @st.fragment
     def render_requests_tab(df: pd.DataFrame) -> None:
         """Render the All Requests tab."""
         st.subheader("All Requests")
@@ -41,48 +197,81 @@ class TabManager:
         # Get filter values (now includes preset_filter)
         search_term, method_filter, status_filter, preset_filter = FilterManager.render_filter_controls(df)
         
-        # Apply filters
+        # Apply filters, selecting only the display columns in the same take
         filtered_df = FilterManager.apply_filters(
             df,
             search_term=search_term,
             method_filter=method_filter,
             status_filter=status_filter,
-            preset_filter=preset_filter
+            preset_filter=preset_filter,
+            columns=REQUEST_DISPLAY_COLUMNS
         )
         
         # Display results
         st.write(f"Showing {len(filtered_df)} of {len(df)} requests")
         
-        # Select only needed columns for display
-        display_columns = ['method', 'endpoint', 'status', 'total_time', 'problems']
+        # Only one page goes over the websocket; the full set is a download
+        page_size = TabManager.REQUESTS_PAGE_SIZE
+        total_rows = len(filtered_df)
+        page_count = max(1, -(-total_rows // page_size))
+        
+        # Back to the first page when a filter leaves fewer pages than selected
+        if st.session_state.get('requests_page', 1) > page_count:
+            st.session_state['requests_page'] = 1
+        
+        page = st.number_input(
+            "Page",
+            min_value=1,
+            max_value=page_count,
+            step=1,
+            key='requests_page',
+            disabled=page_count == 1
+        )
+        
+        start = (page - 1) * page_size
         st.dataframe(
-            filtered_df[display_columns],
+            widen_float32(filtered_df.iloc[start:start + page_size]),
             width='stretch',
             hide_index=True
         )
+        
+        if page_count > 1:
+            st.caption(f"Rows {start + 1}-{min(start + page_size, total_rows)} of {total_rows} (page {page} of {page_count})")
+            filter_key = (search_term, method_filter, status_filter, preset_filter)
+            st.download_button(
+                "⬇️ Download all filtered requests (CSV)",
+                data=filtered_requests_csv(
+                    st.session_state.get(SessionViews.HASH_KEY, ''), filter_key, filtered_df
+                ),
+                file_name='filtered_requests.csv',
+                mime='text/csv',
+                on_click='ignore'
+            )
     
     @staticmethod
+    @st.fragment
     def render_problematic_tab(df: pd.DataFrame) -> None:
         """Render the Problematic APIs tab."""
         st.subheader("Problematic APIs")
         
-        # Use vectorized filtering instead of boolean indexing
-        problematic_df = df.query('is_problematic == True').sort_values('total_time', ascending=False)
+        # Slowest rows, sorted and narrowed to display columns once per HAR file
+        problematic_count = len(SessionViews.get('problematic_idx', df))
+        problematic_df = SessionViews.get('problematic_df', df)
         
         if problematic_df.empty:
             st.success("✅ No problematic APIs found!")
         else:
-            st.warning(f"⚠️ Found {len(problematic_df)} problematic requests")
-            
-            # Select only needed columns for display
-            display_columns = ['method', 'endpoint', 'status', 'total_time', 'problems']
+            st.warning(f"⚠️ Found {problematic_count} problematic requests")
+            if problematic_count > len(problematic_df):
+                st.caption(f"Showing the {len(problematic_df)} slowest")
             st.dataframe(
-                problematic_df[display_columns],
+                widen_float32(problematic_df),
                 width='stretch',
                 hide_index=True
             )
     
     @staticmethod
+    @st.fragment
     def render_timing_tab(df: pd.DataFrame) -> None:
         """Render the Timing Analysis tab."""
         st.subheader("Detailed Timing Analysis")
@@ -92,30 +281,27 @@ class TabManager:
         st.markdown("---")
         
         # Show timing breakdown chart with unique key
-        fig_timing, key_timing = ChartFactory.create_timing_breakdown_chart(df, key="timing_analysis_breakdown")
-        st.plotly_chart(fig_timing, use_container_width=True, key=key_timing)
+        st.plotly_chart(
+            SessionViews.get('charts', df)['timing_breakdown'],
+            use_container_width=True,
+            key="timing_analysis_breakdown"
+        )
         
-        # Show average timing by endpoint - optimized with vectorized operations
+        # Show average timing by endpoint (computed once per HAR file)
         st.subheader("Average Timing by Endpoint")
         
-        # Use vectorized operations instead of groupby for better performance with large datasets
-        timing_cols = ['blocked', 'dns', 'connect', 'send', 'wait', 'receive', 'ssl']
-        
-        # Limit to top endpoints for better performance
-        top_endpoints = df['endpoint'].value_counts().nlargest(20).index
-        filtered_df = df[df['endpoint'].isin(top_endpoints)]
-        
-        # Use groupby only on the filtered data
-        endpoint_timing = filtered_df.groupby('endpoint')[timing_cols].mean().round(2)
+        endpoint_timing = SessionViews.get('endpoint_timing', df)
         
         st.dataframe(endpoint_timing, width='stretch')
     
     @staticmethod
+    @st.fragment
     def render_endpoint_tab(df: pd.DataFrame) -> None:
         """Render the Endpoint Summary tab."""
         st.subheader("Endpoint Performance Summary")
         
-        endpoint_stats = PerformanceAnalyzer.get_slowest_endpoints(df, limit=50)
+        # Narrowed to display columns once per HAR file
+        endpoint_stats = SessionViews.get('endpoint_stats', df)
         
         st.dataframe(
             endpoint_stats,
@@ -124,51 +310,51 @@ class TabManager:
         )
         
         # Show chart with unique key for endpoint tab
-        fig_endpoints, key_endpoints = ChartFactory.create_slowest_endpoints_chart(
-            df, 
-            limit=20, 
+        st.plotly_chart(
+            SessionViews.get('charts', df)['slowest_endpoints_top20'],
+            use_container_width=True,
             key="endpoint_tab_slowest"
         )
-        st.plotly_chart(fig_endpoints, use_container_width=True, key=key_endpoints)    
+    
     @staticmethod
+    @st.fragment
     def render_domain_analysis_tab(df: pd.DataFrame) -> None:
         """Render the Domain Analysis tab."""
-        from analyzers.domain_analyzer import DomainAnalyzer
-        
         st.subheader("🌐 Domain Analysis")
         
-        # Get domain statistics
-        domain_stats = DomainAnalyzer.analyze_by_domain(df)
+        # Domain statistics, third-party and CDN analysis are built once per HAR file
+        domain_view = SessionViews.get('domain_view', df)
+        domain_stats = domain_view['domain_stats']
         
         if domain_stats.empty:
             st.warning("No domain data available")
             return
         
-        # Third-party analysis
-        third_party_analysis = DomainAnalyzer.identify_third_party_domains(df)
+        third_party_analysis = domain_view['third_party']
         
         # Display metrics
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Domains", len(domain_stats))
-        with col2:
-            st.metric("Main Domain", third_party_analysis['main_domain'])
-        with col3:
-            st.metric("Third-Party %", f"{third_party_analysis['third_party_percentage']:.1f}%")
+        MetricsDisplay.render_metric_row([
+            ("Total Domains", len(domain_stats)),
+            ("Main Domain", third_party_analysis['main_domain']),
+            ("Third-Party %", f"{third_party_analysis['third_party_percentage']:.1f}%")
+        ])
         
         st.markdown("---")
         
         # Domain performance chart
-        fig_domain, key_domain = ChartFactory.create_domain_performance_chart(domain_stats, key="domain_analysis")
+        fig_domain = domain_view['domain_chart']
         if fig_domain:
-            st.plotly_chart(fig_domain, use_container_width=True, key=key_domain)
+            st.plotly_chart(fig_domain, use_container_width=True, key="domain_analysis")
         
         # CDN detection
         st.subheader("CDN Usage")
-        cdn_usage = DomainAnalyzer.detect_cdn_usage(df)
+        cdn_usage = domain_view['cdn_usage']
         if cdn_usage:
-            for cdn in cdn_usage:
-                st.info(f"**{cdn['cdn_name']}**: {cdn['request_count']} requests, Avg time: {cdn['avg_time']:.1f}ms")
+            # One element for all CDNs instead of one per CDN
+            st.info("\n".join(
+                f"- **{cdn['cdn_name']}**: {cdn['request_count']} requests, Avg time: {cdn['avg_time']:.1f}ms"
+                for cdn in cdn_usage
+            ))
         else:
             st.info("No CDN usage detected")
         
@@ -176,81 +362,71 @@ class TabManager:
         
         # Domain statistics table
         st.subheader("Domain Statistics")
-        st.dataframe(domain_stats, width='stretch', hide_index=True)
+        st.dataframe(widen_float32(domain_stats), width='stretch', hide_index=True)
     
     @staticmethod
+    @st.fragment
     def render_recommendations_tab(df: pd.DataFrame) -> None:
         """Render the Recommendations tab."""
-        from analyzers.recommendation_engine import RecommendationEngine
-        
         st.subheader("💡 Performance Recommendations")
         
-        recommendations = RecommendationEngine.generate_recommendations(df)
+        # Generated and grouped by priority once per HAR file
+        recommendations = SessionViews.get('recommendations', df)
         
-        if not recommendations:
+        if not recommendations['total']:
             st.success("✅ No recommendations - your application is performing well!")
             return
         
-        st.write(f"Found **{len(recommendations)}** recommendations to improve performance:")
-        
-        # Group by priority
-        high_priority = [r for r in recommendations if r.priority == 'High']
-        medium_priority = [r for r in recommendations if r.priority == 'Medium']
-        low_priority = [r for r in recommendations if r.priority == 'Low']
-        
-        # Display high priority
-        if high_priority:
-            st.markdown("### 🔴 High Priority")
-            for rec in high_priority:
-                with st.expander(f"**{rec.title}** ({rec.category})"):
-                    st.write(f"**Description:** {rec.description}")
-                    st.write(f"**Impact:** {rec.impact}")
-                    st.write(f"**Effort:** {rec.effort}")
-        
-        # Display medium priority
-        if medium_priority:
-            st.markdown("### 🟡 Medium Priority")
-            for rec in medium_priority:
-                with st.expander(f"**{rec.title}** ({rec.category})"):
-                    st.write(f"**Description:** {rec.description}")
-                    st.write(f"**Impact:** {rec.impact}")
-                    st.write(f"**Effort:** {rec.effort}")
-        
-        # Display low priority
-        if low_priority:
-            st.markdown("### 🟢 Low Priority")
-            for rec in low_priority:
-                with st.expander(f"**{rec.title}** ({rec.category})"):
-                    st.write(f"**Description:** {rec.description}")
-                    st.write(f"**Impact:** {rec.impact}")
-                    st.write(f"**Effort:** {rec.effort}")
+        st.write(f"Found **{recommendations['total']}** recommendations to improve performance:")
+        
+        priority_headers = {
+            'High': "### 🔴 High Priority",
+            'Medium': "### 🟡 Medium Priority",
+            'Low': "### 🟢 Low Priority"
+        }
+        buckets = recommendations['by_priority']
+        
+        for priority, header in priority_headers.items():
+            if not buckets[priority]:
+                continue
+            
+            st.markdown(header)
+            
+            # One expander per priority holding all of its items as a single
+            # markdown block, instead of an expander and three writes per item
+            with st.expander(f"Recommendations ({len(buckets[priority])})", expanded=priority == 'High'):
+                st.markdown("\n\n".join(
+                    f"**{rec.title}** ({rec.category})\n"
+                    f"- **Description:** {rec.description}\n"
+                    f"- **Impact:** {rec.impact}\n"
+                    f"- **Effort:** {rec.effort}"
+                    for rec in buckets[priority]
+                ))
     
     @staticmethod
+    @st.fragment
     def render_resource_analysis_tab(df: pd.DataFrame) -> None:
         """Render the Resource Analysis tab."""
-        from analyzers.resource_analyzer import ResourceAnalyzer
-        
         st.subheader("📦 Resource Analysis")
         
-        # Resource statistics
-        resource_stats = ResourceAnalyzer.analyze_by_resource_type(df)
+        # Resource statistics and derived tables are built once per HAR file
+        resource_view = SessionViews.get('resource_view', df)
+        resource_stats = resource_view['resource_stats']
         
         if resource_stats.empty:
             st.warning("No resource data available")
             return
         
         # Display metrics
-        total_size = resource_stats['total_size'].sum()
-        total_count = resource_stats['count'].sum()
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Resources", int(total_count))
-        with col2:
-            st.metric("Total Size", f"{total_size / 1024:.1f} KB")
-        with col3:
-            avg_size = total_size / total_count if total_count > 0 else 0
-            st.metric("Avg Size", f"{avg_size / 1024:.1f} KB")
+        total_size = resource_view['total_size']
+        total_count = resource_view['total_count']
+        avg_size = resource_view['avg_size']
+        
+        MetricsDisplay.render_metric_row([
+            ("Total Resources", total_count),
+            ("Total Size", f"{total_size / 1024:.1f} KB"),
+            ("Avg Size", f"{avg_size / 1024:.1f} KB")
+        ])
         
         st.markdown("---")
         
@@ -258,24 +434,24 @@ class TabManager:
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_resource, key_resource = ChartFactory.create_resource_size_chart(resource_stats, key="resource_size")
+            fig_resource = resource_view['resource_chart']
             if fig_resource:
-                st.plotly_chart(fig_resource, use_container_width=True, key=key_resource)
+                st.plotly_chart(fig_resource, use_container_width=True, key="resource_size")
         
         with col2:
-            fig_scatter, key_scatter = ChartFactory.create_size_vs_time_scatter(df, key="size_vs_time")
+            fig_scatter = SessionViews.get('charts', df)['size_vs_time']
             if fig_scatter:
-                st.plotly_chart(fig_scatter, use_container_width=True, key=key_scatter)
+                st.plotly_chart(fig_scatter, use_container_width=True, key="size_vs_time")
         
         st.markdown("---")
         
         # Large resources
         st.subheader("Large Resources (>100KB)")
-        large_resources = ResourceAnalyzer.identify_large_resources(df)
+        large_resources = resource_view['large_resources']
         
         if not large_resources.empty:
             st.warning(f"Found {len(large_resources)} large resources")
-            st.dataframe(large_resources, width='stretch', hide_index=True)
+            st.dataframe(widen_float32(large_resources), width='stretch', hide_index=True)
         else:
             st.success("✅ No large resources found")
         
@@ -283,20 +459,22 @@ class TabManager:
         
         # Compression analysis
         st.subheader("Compression Opportunities")
-        compression = ResourceAnalyzer.analyze_compression_opportunities(df)
+        compression = resource_view['compression']
         
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Compressible Size", f"{compression['compressible_size'] / 1024:.1f} KB")
-        with col2:
-            st.metric("Potential Savings", f"{compression['potential_savings'] / 1024:.1f} KB ({compression['savings_percentage']:.1f}%)")
+        MetricsDisplay.render_metric_row([
+            ("Compressible Size", f"{compression['compressible_size'] / 1024:.1f} KB"),
+            ("Potential Savings", f"{compression['potential_savings'] / 1024:.1f} KB ({compression['savings_percentage']:.1f}%)")
+        ])
         
         if compression['recommendations']:
             st.write("**Recommendations by resource type:**")
-            for rec in compression['recommendations']:
-                st.info(f"**{rec['resource_type']}**: {rec['file_count']} files, potential savings: {rec['estimated_savings']/1024:.1f}KB")
+            st.info("\n".join(
+                f"- **{rec['resource_type']}**: {rec['file_count']} files, potential savings: {rec['estimated_savings']/1024:.1f}KB"
+                for rec in compression['recommendations']
+            ))
     
     @staticmethod
+    @st.fragment
     def render_advanced_stats_tab(df: pd.DataFrame) -> None:
         """Render the Advanced Statistics tab."""
         st.subheader("📊 Advanced Statistical Analysis")
@@ -304,83 +482,68 @@ class TabManager:
         # Percentile analysis - optimized with vectorized operations
         st.markdown("### Response Time Percentiles")
         
-        # Calculate percentiles in a single operation
-        percentiles_values = df['total_time'].quantile([0.5, 0.75, 0.9, 0.95, 0.99])
+        # Percentiles and summary statistics are computed once per HAR file
+        time_stats = SessionViews.get('time_stats', df)
         percentile_labels = ['P50 (Median)', 'P75', 'P90', 'P95', 'P99']
         
-        cols = st.columns(5)
-        for i, (label, value) in enumerate(zip(percentile_labels, percentiles_values)):
-            with cols[i]:
-                st.metric(label, f"{value:.0f}ms")
+        MetricsDisplay.render_metric_row([
+            (label, f"{value:.0f}ms") for label, value in zip(percentile_labels, time_stats['percentiles'])
+        ])
         
         # Percentile chart
-        fig_percentile, key_percentile = ChartFactory.create_percentile_chart(df, key="percentile_chart")
+        fig_percentile = SessionViews.get('charts', df)['percentile']
         if fig_percentile:
-            st.plotly_chart(fig_percentile, use_container_width=True, key=key_percentile)
+            st.plotly_chart(fig_percentile, use_container_width=True, key="percentile_chart")
         
         st.markdown("---")
         
         # Statistical measures - optimized with vectorized operations
         st.markdown("### Statistical Measures")
         
-        # Calculate all statistics in a single operation
-        stats = df['total_time'].agg(['mean', 'std', 'min', 'max'])
+        stats = time_stats['summary']
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Mean", f"{stats['mean']:.1f}ms")
-        with col2:
-            st.metric("Std Dev", f"{stats['std']:.1f}ms")
-        with col3:
-            st.metric("Min", f"{stats['min']:.1f}ms")
-        with col4:
-            st.metric("Max", f"{stats['max']:.1f}ms")
+        MetricsDisplay.render_metric_row([
+            ("Mean", f"{stats['mean']:.1f}ms"),
+            ("Std Dev", f"{stats['std']:.1f}ms"),
+            ("Min", f"{stats['min']:.1f}ms"),
+            ("Max", f"{stats['max']:.1f}ms")
+        ])
         
         st.markdown("---")
         
         # Outlier detection - optimized with vectorized operations
         st.markdown("### Outlier Detection")
         
-        # Calculate outliers using vectorized operations
-        mean = df['total_time'].mean()
-        std = df['total_time'].std()
-        outlier_mask = df['total_time'] > mean + 3 * std
-        outliers = df[outlier_mask]
+        # Outliers and their threshold are derived once from the mean/std above
+        outliers_df = time_stats['outliers_df']
         
-        if not outliers.empty:
-            st.warning(f"Found {len(outliers)} outliers (>3 standard deviations from mean)")
-            # Select only needed columns for display
-            display_cols = ['endpoint', 'total_time', 'status']
-            st.dataframe(
-                outliers[display_cols],
-                width='stretch',
-                hide_index=True
+        if not outliers_df.empty:
+            st.warning(
+                f"Found {len(outliers_df)} outliers (>{SessionViews.OUTLIER_STD_THRESHOLD} standard deviations "
+                f"from mean, above {time_stats['outlier_threshold']:.0f}ms)"
             )
+            st.dataframe(widen_float32(outliers_df), width='stretch', hide_index=True)
         else:
             st.success("✅ No significant outliers detected")
     
     @staticmethod
+    @st.fragment
     def render_caching_analysis_tab(df: pd.DataFrame) -> None:
         """Render the Caching Analysis tab."""
-        from analyzers.cache_analyzer import CacheAnalyzer
-        
         st.subheader("💾 Caching Analysis")
         
         # Get caching analysis
-        cache_analysis = CacheAnalyzer.analyze_caching_opportunities(df)
-        repeat_savings = CacheAnalyzer.calculate_repeat_visit_savings(df)
+        cache_view = SessionViews.get('cache_view', df)
+        cache_analysis = cache_view['analysis']
+        repeat_savings = cache_view['repeat_savings']
         
         # Display metrics
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Requests", cache_analysis['total_requests'])
-        with col2:
-            st.metric("Cacheable", f"{cache_analysis['cacheable_requests']} ({cache_analysis['cacheable_percentage']:.1f}%)")
-        with col3:
-            st.metric("Potential Savings", f"{cache_analysis['potential_savings_kb']:.1f} KB")
-        with col4:
-            st.metric("Repeat Visit Savings", f"{repeat_savings['time_saved_seconds']:.1f}s")
+        MetricsDisplay.render_metric_row([
+            ("Total Requests", cache_analysis['total_requests']),
+            ("Cacheable", f"{cache_analysis['cacheable_requests']} ({cache_analysis['cacheable_percentage']:.1f}%)"),
+            ("Potential Savings", f"{cache_analysis['potential_savings_kb']:.1f} KB"),
+            ("Repeat Visit Savings", f"{repeat_savings['time_saved_seconds']:.1f}s")
+        ])
         
         st.markdown("---")
         
@@ -388,12 +551,11 @@ class TabManager:
         st.subheader("Cache Duration Recommendations")
         
         if cache_analysis['recommendations']:
-            for rec in cache_analysis['recommendations']:
-                priority_color = "🔴" if rec['priority'] == 'High' else "🟡"
-                st.info(
-                    f"{priority_color} **{rec['resource_type']}**: {rec['count']} files, "
-                    f"{rec['total_size']/1024:.1f}KB - Recommended: `{rec['recommended_duration']}`"
-                )
+            st.info("\n".join(
+                f"- {'🔴' if rec['priority'] == 'High' else '🟡'} **{rec['resource_type']}**: {rec['count']} files, "
+                f"{rec['total_size']/1024:.1f}KB - Recommended: `{rec['recommended_duration']}`"
+                for rec in cache_analysis['recommendations']
+            ))
         else:
             st.success("✅ No specific caching recommendations")
         
@@ -402,49 +564,45 @@ class TabManager:
         # Repeat visit savings breakdown
         st.subheader("Repeat Visit Performance")
         
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Bandwidth Saved", f"{repeat_savings['bandwidth_saved_mb']:.2f} MB")
-            st.metric("Time Saved", f"{repeat_savings['time_saved_seconds']:.2f} seconds")
-        with col2:
-            st.metric("Requests Saved", repeat_savings['requests_saved'])
-            st.metric("Cache Hit Rate", f"{repeat_savings['cache_hit_rate']:.0f}%")
+        MetricsDisplay.render_metric_row([
+            ("Bandwidth Saved", f"{repeat_savings['bandwidth_saved_mb']:.2f} MB"),
+            ("Time Saved", f"{repeat_savings['time_saved_seconds']:.2f} seconds"),
+            ("Requests Saved", repeat_savings['requests_saved']),
+            ("Cache Hit Rate", f"{repeat_savings['cache_hit_rate']:.0f}%")
+        ])
         
         st.markdown("---")
         
         # Non-cacheable resources
         st.subheader("Cacheable Resources")
-        non_cacheable = CacheAnalyzer.get_non_cacheable_resources(df)
+        non_cacheable = cache_view['non_cacheable']
         
         if not non_cacheable.empty:
             st.write(f"**{len(non_cacheable)} resources** that should be cached:")
-            st.dataframe(non_cacheable.head(20), width='stretch', hide_index=True)
+            st.dataframe(widen_float32(non_cacheable.head(20)), width='stretch', hide_index=True)
         else:
             st.info("All cacheable resources are properly configured")
     
     @staticmethod
+    @st.fragment
     def render_security_analysis_tab(df: pd.DataFrame) -> None:
         """Render the Security Analysis tab."""
-        from analyzers.security_analyzer import SecurityAnalyzer
-        
         st.subheader("🔒 Security Analysis")
         
         # Get security analysis
-        security = SecurityAnalyzer.analyze_security(df)
-        protocol_breakdown = SecurityAnalyzer.get_protocol_breakdown(df)
+        security_view = SessionViews.get('security_view', df)
+        security = security_view['security']
+        protocol_breakdown = security_view['protocol_breakdown']
         
         # Security score
-        col1, col2, col3 = st.columns([1, 2, 1])
+        score_color = "🟢" if security['security_score'] >= 80 else "🟡" if security['security_score'] >= 60 else "🔴"
         
-        with col1:
-            # Security score gauge
-            score_color = "🟢" if security['security_score'] >= 80 else "🟡" if security['security_score'] >= 60 else "🔴"
-            st.metric("Security Score", f"{score_color} {security['security_score']}/100")
-            st.metric("Grade", security['grade'])
-        
-        with col2:
-            st.metric("HTTP Requests", f"{protocol_breakdown['http_count']} ({protocol_breakdown['http_percentage']:.1f}%)")
-            st.metric("HTTPS Requests", f"{protocol_breakdown['https_count']} ({protocol_breakdown['https_percentage']:.1f}%)")
+        MetricsDisplay.render_metric_row([
+            ("Security Score", f"{score_color} {security['security_score']}/100"),
+            ("Grade", security['grade']),
+            ("HTTP Requests", f"{protocol_breakdown['http_count']} ({protocol_breakdown['http_percentage']:.1f}%)"),
+            ("HTTPS Requests", f"{protocol_breakdown['https_count']} ({protocol_breakdown['https_percentage']:.1f}%)")
+        ])
         
         st.markdown("---")
         
@@ -452,12 +610,13 @@ class TabManager:
         st.subheader("Security Issues")
         
         if security['issues']:
-            for issue in security['issues']:
-                severity_icon = "🔴" if issue['severity'] == 'High' else "🟡" if issue['severity'] == 'Medium' else "🟢"
-                
-                with st.expander(f"{severity_icon} **{issue['category']}** - {issue['severity']} Severity"):
-                    st.write(f"**Description:** {issue['description']}")
-                    st.write(f"**Impact:** {issue['impact']}")
+            # One markdown block for all issues instead of an expander each
+            st.markdown("\n\n".join(
+                f"{TabManager.SEVERITY_ICONS.get(issue['severity'], '🟢')} **{issue['category']}** - {issue['severity']} Severity\n"
+                f"- **Description:** {issue['description']}\n"
+                f"- **Impact:** {issue['impact']}"
+                for issue in security['issues']
+            ))
         else:
             st.success("✅ No security issues detected!")
         
@@ -467,11 +626,10 @@ class TabManager:
         st.subheader("Security Recommendations")
         
         if security['recommendations']:
-            for rec in security['recommendations']:
-                priority_icon = "🔴" if rec['priority'] == 'High' else "🟡"
-                
-                with st.expander(f"{priority_icon} **{rec['title']}**"):
-                    st.write(rec['description'])
+            st.markdown("\n".join(
+                f"- {'🔴' if rec['priority'] == 'High' else '🟡'} **{rec['title']}**: {rec['description']}"
+                for rec in security['recommendations']
+            ))
         else:
             st.success("✅ No security recommendations - good job!")
         
@@ -480,69 +638,39 @@ class TabManager:
         # Protocol breakdown chart
         st.subheader("Protocol Distribution")
         
-        fig = go.Figure(data=[
-            go.Pie(
-                labels=['HTTPS', 'HTTP'],
-                values=[protocol_breakdown['https_count'], protocol_breakdown['http_count']],
-                marker_colors=['green', 'red']
-            )
-        ])
-        
-        fig.update_layout(title="HTTP vs HTTPS Requests")
-        st.plotly_chart(fig, use_container_width=True)
+        # Built once per HAR file with the rest of the security view
+        st.plotly_chart(security_view['protocol_chart'], use_container_width=True, key="security_protocol_chart")
     
     @staticmethod
+    @st.fragment
     def render_performance_budget_tab(df: pd.DataFrame) -> None:
         """Render the Performance Budget tab."""
-        from models.performance_budget import PerformanceBudgetTracker, PerformanceBudget
-        
         st.subheader("📊 Performance Budget")
         
-        # Initialize budget tracker
-        budget_tracker = PerformanceBudgetTracker()
-        budget_check = budget_tracker.check_budget(df)
-        utilization = budget_tracker.get_budget_utilization(df)
+        # Budget results against the default thresholds
+        budget_view = SessionViews.get('budget_view', df)
+        budget_check = budget_view['check']
+        budget = budget_check['budget']
         
         # Budget health score
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            health_icon = "🟢" if budget_check['health_score'] >= 80 else "🟡" if budget_check['health_score'] >= 60 else "🔴"
-            st.metric("Budget Health", f"{health_icon} {budget_check['health_score']}/100")
-        
-        with col2:
-            status_icon = "✅" if budget_check['meets_budget'] else "⚠️"
-            st.metric("Status", f"{status_icon} {'Pass' if budget_check['meets_budget'] else 'Fail'}")
+        health_icon = "🟢" if budget_check['health_score'] >= 80 else "🟡" if budget_check['health_score'] >= 60 else "🔴"
+        status_icon = "✅" if budget_check['meets_budget'] else "⚠️"
         
-        with col3:
-            st.metric("Violations", budget_check['violation_count'])
+        MetricsDisplay.render_metric_row([
+            ("Budget Health", f"{health_icon} {budget_check['health_score']}/100"),
+            ("Status", f"{status_icon} {'Pass' if budget_check['meets_budget'] else 'Fail'}"),
+            ("Violations", budget_check['violation_count'])
+        ])
         
         st.markdown("---")
         
         # Budget utilization
         st.subheader("Budget Utilization")
         
-        for metric_name, metric_data in utilization.items():
-            metric_label = metric_name.replace('_', ' ').title()
-            utilization_pct = metric_data['utilization']
-            
-            # Color code based on utilization
-            if utilization_pct <= 80:
-                color = "🟢"
-            elif utilization_pct <= 100:
-                color = "🟡"
-            else:
-                color = "🔴"
-            
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.progress(min(utilization_pct / 100, 1.0))
-            
-            with col2:
-                st.write(f"{color} **{utilization_pct:.0f}%**")
-            
-            st.caption(f"{metric_label}: {metric_data['current']} / {metric_data['budget']}")
+        # One chart for all metrics, built once per HAR file
+        utilization_chart = budget_view['utilization_chart']
+        if utilization_chart:
+            st.plotly_chart(utilization_chart, use_container_width=True, key="budget_utilization_chart")
         
         st.markdown("---")
         
@@ -550,13 +678,14 @@ class TabManager:
         if budget_check['violations']:
             st.subheader("⚠️ Budget Violations")
             
-            for violation in budget_check['violations']:
-                severity_icon = "🔴" if violation['severity'] == 'High' else "🟡" if violation['severity'] == 'Medium' else "🟢"
-                
-                with st.expander(f"{severity_icon} **{violation['metric']}** - {violation['severity']} Severity"):
-                    st.write(f"**Current:** {violation['current']}")
-                    st.write(f"**Budget:** {violation['budget']}")
-                    st.write(f"**Exceeded by:** {violation['exceeded_by']}")
+            # One markdown block for all violations instead of an expander each
+            st.markdown("\n\n".join(
+                f"{TabManager.SEVERITY_ICONS.get(violation['severity'], '🟢')} **{violation['metric']}** - {violation['severity']} Severity\n"
+                f"- **Current:** {violation['current']}\n"
+                f"- **Budget:** {violation['budget']}\n"
+                f"- **Exceeded by:** {violation['exceeded_by']}"
+                for violation in budget_check['violations']
+            ))
         else:
             st.success("✅ All metrics within budget!")
         
@@ -566,36 +695,33 @@ class TabManager:
         with st.expander("⚙️ Budget Configuration"):
             st.write("**Current Budget Thresholds:**")
             st.json({
-                'max_requests': budget_tracker.budget.max_requests,
-                'max_total_size_kb': budget_tracker.budget.max_total_size_kb,
-                'max_response_time_ms': budget_tracker.budget.max_response_time_ms,
-                'max_slow_requests': budget_tracker.budget.max_slow_requests,
-                'max_error_rate_percent': budget_tracker.budget.max_error_rate_percent,
-                'max_js_size_kb': budget_tracker.budget.max_js_size_kb,
-                'max_css_size_kb': budget_tracker.budget.max_css_size_kb,
-                'max_image_size_kb': budget_tracker.budget.max_image_size_kb
+                'max_requests': budget.max_requests,
+                'max_total_size_kb': budget.max_total_size_kb,
+                'max_response_time_ms': budget.max_response_time_ms,
+                'max_slow_requests': budget.max_slow_requests,
+                'max_error_rate_percent': budget.max_error_rate_percent,
+                'max_js_size_kb': budget.max_js_size_kb,
+                'max_css_size_kb': budget.max_css_size_kb,
+                'max_image_size_kb': budget.max_image_size_kb
             })
     
     @staticmethod
+    @st.fragment
     def render_waterfall_tab(df: pd.DataFrame) -> None:
         """Render the Waterfall Visualization tab."""
-        from visualizations.waterfall import WaterfallChart
-        
         st.subheader("📈 Request Waterfall Timeline")
         
         # Request pattern analysis
-        patterns = WaterfallChart.analyze_request_patterns(df)
+        waterfall_view = SessionViews.get('waterfall_view', df)
+        patterns = waterfall_view['patterns']
         
         if patterns['analysis_available']:
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Total Requests", patterns['total_requests'])
-            with col2:
-                st.metric("Parallel Requests", patterns['parallel_requests'])
-            with col3:
-                st.metric("Sequential Requests", patterns['sequential_requests'])
-            with col4:
-                st.metric("Parallelization", f"{patterns['parallelization_ratio']:.1f}%")
+            MetricsDisplay.render_metric_row([
+                ("Total Requests", patterns['total_requests']),
+                ("Parallel Requests", patterns['parallel_requests']),
+                ("Sequential Requests", patterns['sequential_requests']),
+                ("Parallelization", f"{patterns['parallelization_ratio']:.1f}%")
+            ])
             
             st.markdown("---")
         
@@ -618,10 +744,12 @@ class TabManager:
         st.markdown("---")
         
         # Create waterfall chart
-        if chart_type == "Detailed (Timing Phases)":
-            fig, key = WaterfallChart.create_waterfall(df, max_requests=max_requests)
-        else:
-            fig, key = WaterfallChart.create_simplified_waterfall(df, max_requests=max_requests)
+        fig, key = waterfall_figure(
+            st.session_state.get(SessionViews.HASH_KEY, ''),
+            chart_type == "Detailed (Timing Phases)",
+            max_requests,
+            df
+        )
         
         if fig:
             st.plotly_chart(fig, use_container_width=True, key=key)
@@ -632,7 +760,7 @@ class TabManager:
         
         # Critical path
         st.subheader("🎯 Critical Path (Slowest Requests)")
-        critical_path = WaterfallChart.identify_critical_path(df)
+        critical_path = waterfall_view['critical_path']
         
         if critical_path:
             for i, req in enumerate(critical_path, 1):
@@ -641,10 +769,9 @@ class TabManager:
             st.info("No critical path data available")
     
     @staticmethod
+    @st.fragment
     def render_comparative_analysis_tab(df: pd.DataFrame) -> None:
         """Render the Comparative Analysis tab."""
-        from analyzers.comparative_analyzer import ComparativeAnalyzer
-        
         st.subheader("📊 Comparative Analysis")
         
         st.info("💡 **How to use:** Upload a second HAR file to compare with current one. This is useful for before/after optimization analysis.")
@@ -661,8 +788,6 @@ class TabManager:
         
         if comparison_file is not None:
             # Parse comparison file
-            from parsers.har_parser import HARParser
-            
             comparison_content = comparison_file.read().decode('utf-8')
             df2, error = HARParser.parse(comparison_content)
             
@@ -743,7 +868,7 @@ class TabManager:
             st.subheader("📊 Detailed Metrics Comparison")
             
             comparison_df = ComparativeAnalyzer.create_comparison_dataframe(comparison)
-            st.dataframe(comparison_df, width='stretch', hide_index=True)
+            st.dataframe(widen_float32(comparison_df), width='stretch', hide_index=True)
             
             st.markdown("---")
             
@@ -757,7 +882,7 @@ class TabManager:
                 improved = endpoint_comparison[endpoint_comparison['improved']].head(10)
                 if not improved.empty:
                     st.markdown("#### ✅ Top 10 Improved Endpoints")
-                    st.dataframe(improved, width='stretch', hide_index=True)
+                    st.dataframe(widen_float32(improved), width='stretch', hide_index=True)
                 
                 st.markdown("---")
                 
@@ -765,7 +890,7 @@ class TabManager:
                 degraded = endpoint_comparison[~endpoint_comparison['improved']].head(10)
                 if not degraded.empty:
                     st.markdown("#### ⚠️ Top 10 Degraded Endpoints")
-                    st.dataframe(degraded, width='stretch', hide_index=True)
+                    st.dataframe(widen_float32(degraded), width='stretch', hide_index=True)
             else:
                 st.info("No common endpoints found between the two HAR files")
         
@@ -773,92 +898,54 @@ class TabManager:
             st.info("👆 Upload a second HAR file above to start comparison")
             
             # Show example use cases
-            with st.expander("📖 Use Cases for Comparative Analysis"):
-                st.markdown("""
-                **Comparative analysis is useful for:**
-                
-                1. **Before/After Optimization**
-                   - Compare performance before and after implementing optimizations
-                   - Measure impact of code changes
-                
-                2. **A/B Testing**
-                   - Compare different versions of your application
-                   - Validate performance improvements
-                
-                3. **Regression Detection**
-                   - Identify performance degradations
-                   - Track performance over time
-                
-                4. **Environment Comparison**
-                   - Compare production vs staging performance
-                   - Compare different deployment configurations
-                
-                5. **Feature Impact Analysis**
-                   - Measure performance impact of new features
-                   - Identify bottlenecks introduced by changes
-                """)
+            TabManager._render_reference_section("📖 Use Cases for Comparative Analysis", COMPARATIVE_USE_CASES_MD, key="show_comparative_use_cases")
     
     @staticmethod
+    @st.fragment
     def render_connection_analysis_tab(df: pd.DataFrame) -> None:
         """Render the Connection Analysis tab."""
-        from analyzers.connection_analyzer import ConnectionAnalyzer
-        
         st.subheader("🔌 Connection Analysis")
         
-        # Get connection analysis
-        analysis = ConnectionAnalyzer.analyze_connections(df)
-        
-        if not analysis['analysis_available']:
-            st.warning("Connection analysis not available for this HAR file")
+        # Skip all connection work for HARs captured without connect/ssl timings
+        if not SessionViews.get('has_connection_timings', df):
+            st.warning("Connection analysis not available for this HAR file (no connection timings recorded)")
             return
         
+        # Analysis and formatted opportunities are built once per HAR file
+        connection_view = SessionViews.get('connection_view', df)
+        analysis = connection_view['analysis']
+        
         # Display metrics
-        col1, col2, col3, col4 = st.columns(4)
+        reuse_color = "🟢" if analysis['connection_reuse_ratio'] >= 80 else "🟡" if analysis['connection_reuse_ratio'] >= 50 else "🔴"
         
-        with col1:
-            st.metric("Total Requests", analysis['total_requests'])
-        with col2:
-            st.metric("New Connections", analysis['new_connections'])
-        with col3:
-            st.metric("Reused Connections", analysis['reused_connections'])
-        with col4:
-            reuse_color = "🟢" if analysis['connection_reuse_ratio'] >= 80 else "🟡" if analysis['connection_reuse_ratio'] >= 50 else "🔴"
-            st.metric("Reuse Ratio", f"{reuse_color} {analysis['connection_reuse_ratio']:.1f}%")
+        MetricsDisplay.render_metric_row([
+            ("Total Requests", analysis['total_requests']),
+            ("New Connections", analysis['new_connections']),
+            ("Reused Connections", analysis['reused_connections']),
+            ("Reuse Ratio", f"{reuse_color} {analysis['connection_reuse_ratio']:.1f}%")
+        ])
         
         st.markdown("---")
         
         # Connection timing
         st.subheader("⏱️ Connection Timing")
         
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("Avg Connect Time", f"{analysis['avg_connect_time']:.1f}ms")
-        with col2:
-            st.metric("Avg SSL Time", f"{analysis['avg_ssl_time']:.1f}ms")
-        with col3:
-            st.metric("Connect Time %", f"{analysis['connect_time_percentage']:.1f}%")
+        MetricsDisplay.render_metric_row([
+            ("Avg Connect Time", f"{analysis['avg_connect_time']:.1f}ms"),
+            ("Avg SSL Time", f"{analysis['avg_ssl_time']:.1f}ms"),
+            ("Connect Time %", f"{analysis['connect_time_percentage']:.1f}%")
+        ])
         
         st.markdown("---")
         
         # Optimization opportunities
         st.subheader("💡 Optimization Opportunities")
         
-        opportunities = ConnectionAnalyzer.identify_connection_opportunities(df)
+        opps_df = connection_view['opportunities_df']
         
-        if opportunities:
-            for opp in opportunities:
-                priority_icon = "🔴" if opp['priority'] == 'High' else "🟡"
-                
-                with st.expander(f"{priority_icon} **{opp['title']}** ({opp['category']})"):
-                    st.write(f"**Description:** {opp['description']}")
-                    st.write(f"**Impact:** {opp['impact']}")
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Current", opp['current_value'])
-                    with col2:
-                        st.metric("Target", opp['target_value'])
+        if not opps_df.empty:
+            # One table instead of an expander and metrics per opportunity
+            st.dataframe(opps_df, width='stretch', hide_index=True)
         else:
             st.success("✅ No connection optimization opportunities found - connections are well optimized!")
         
@@ -867,58 +954,65 @@ class TabManager:
         # Connection breakdown by domain
         st.subheader("🌐 Connection Breakdown by Domain")
         
-        breakdown = ConnectionAnalyzer.get_connection_breakdown(df)
+        breakdown = connection_view['breakdown']
         
         if not breakdown.empty:
-            st.dataframe(breakdown, width='stretch', hide_index=True)
+            st.dataframe(widen_float32(breakdown), width='stretch', hide_index=True)
         else:
             st.info("No connection breakdown data available")
         
         st.markdown("---")
         
         # Best practices
-        with st.expander("📖 Connection Optimization Best Practices"):
-            st.markdown("""
-            **Connection Reuse Best Practices:**
-            
-            1. **Enable HTTP Keep-Alive**
-               - Allows multiple requests over a single connection
-               - Target: >80% connection reuse ratio
-            
-            2. **Use Connection Pooling**
-               - Reuse connections across requests
-               - Reduces connection setup overhead
-            
-            3. **Optimize SSL/TLS**
-               - Enable TLS session resumption
-               - Use OCSP stapling
-               - Target: <50ms SSL handshake time
-            
-            4. **Consider HTTP/2 or HTTP/3**
-               - Multiplexing reduces connection overhead
-               - Single connection for multiple requests
-               - Eliminates head-of-line blocking (HTTP/3)
-            
-            5. **Use CDN**
-               - Reduces geographic latency
-               - Improves connection times
-               - Target: <50ms connection time
-            
-            6. **Minimize New Connections**
-               - Consolidate resources from same domain
-               - Reduce number of third-party domains
-               - Target: <20% new connections
-            """)
+        TabManager._render_reference_section("📖 Connection Optimization Best Practices", CONNECTION_BEST_PRACTICES_MD, key="show_connection_best_practices")
     
     @staticmethod
+    @st.fragment
     def render_business_impact_tab(df: pd.DataFrame) -> None:
         """Render the Business Impact Analysis tab."""
-        from analyzers.business_analyzer import BusinessAnalyzer
-        
         st.subheader("💰 Business Impact Analysis")
         
         st.info("💡 **Note:** Revenue estimates are based on industry benchmarks. Adjust parameters below for your specific business.")
         
+        # User Experience Score
+        st.subheader("👤 User Experience Score")
+        
+        # Only these depend on the HAR; the business parameters just rescale them
+        business_inputs = SessionViews.get('business_inputs', df)
+        ux_score = business_inputs['ux_score']
+        
+        score_color = "🟢" if ux_score['score'] >= 80 else "🟡" if ux_score['score'] >= 60 else "🔴"
+        ux_metrics = [
+            ("UX Score", f"{score_color} {ux_score['score']}/100"),
+            ("Grade", ux_score['grade']),
+            ("Avg Load Time", f"{ux_score['avg_load_time']:.0f}ms"),
+            ("Consistency (CV)", f"{ux_score['consistency_cv']:.2f}"),
+            ("Error Rate", f"{ux_score['error_rate']:.1f}%"),
+            ("Total Size", f"{ux_score['total_size_mb']:.1f}MB")
+        ]
+        
+        # One flat row instead of a column layout nested inside another
+        MetricsDisplay.render_metric_row(ux_metrics)
+        
+        st.markdown("---")
+        
+        # Parameter inputs rerun only this fragment, not the whole page
+        TabManager._render_business_parameters_fragment(business_inputs['avg_load_time_seconds'])
+        
+        # Industry Benchmarks
+        TabManager._render_reference_section("📊 Industry Benchmarks & Research", BUSINESS_BENCHMARKS_MD, key="show_business_benchmarks")
+    
+    @staticmethod
+    @st.fragment
+    def _render_business_parameters_fragment(avg_load_time_seconds: float) -> None:
+        """
+        Render business parameter inputs and the estimates that depend on them.
+        
+        Runs as a fragment, so changing an input reruns only this section.
+        
+        Args:
+            avg_load_time_seconds: Average load time of the HAR in seconds
+        """
         # Configuration inputs
         st.markdown("### Business Parameters")
         
@@ -956,35 +1050,12 @@ class TabManager:
         
         st.markdown("---")
         
-        # User Experience Score
-        st.subheader("👤 User Experience Score")
-        
-        ux_score = BusinessAnalyzer.calculate_user_experience_score(df)
-        
-        col1, col2 = st.columns([1, 3])
-        
-        with col1:
-            score_color = "🟢" if ux_score['score'] >= 80 else "🟡" if ux_score['score'] >= 60 else "🔴"
-            st.metric("UX Score", f"{score_color} {ux_score['score']}/100")
-            st.metric("Grade", ux_score['grade'])
-        
-        with col2:
-            col_a, col_b, col_c, col_d = st.columns(4)
-            with col_a:
-                st.metric("Avg Load Time", f"{ux_score['avg_load_time']:.0f}ms")
-            with col_b:
-                st.metric("Consistency (CV)", f"{ux_score['consistency_cv']:.2f}")
-            with col_c:
-                st.metric("Error Rate", f"{ux_score['error_rate']:.1f}%")
-            with col_d:
-                st.metric("Total Size", f"{ux_score['total_size_mb']:.1f}MB")
-        
-        st.markdown("---")
-        
         # Conversion Impact
         st.subheader("📈 Conversion Rate Impact")
         
-        conversion_impact = BusinessAnalyzer.estimate_conversion_impact(df, baseline_conversion)
+        conversion_impact = BusinessAnalyzer.estimate_conversion_impact_from_load_time(
+            avg_load_time_seconds, baseline_conversion
+        )
         
         col1, col2, col3 = st.columns(3)
         
@@ -1019,85 +1090,51 @@ class TabManager:
         # Revenue Impact
         st.subheader("💵 Revenue Impact Estimate")
         
-        revenue_impact = BusinessAnalyzer.estimate_revenue_impact(
-            df,
+        revenue_impact = BusinessAnalyzer.estimate_revenue_impact_from_load_time(
+            avg_load_time_seconds,
             monthly_visitors=monthly_visitors,
             average_order_value=avg_order_value,
             baseline_conversion_rate=baseline_conversion
         )
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### Current State")
-            st.metric("Monthly Revenue", f"${revenue_impact['estimated_monthly_revenue']:,.2f}")
-            st.metric("Annual Revenue", f"${revenue_impact['estimated_monthly_revenue'] * 12:,.2f}")
-        
-        with col2:
-            st.markdown("#### Potential Loss")
-            st.metric(
-                "Monthly Loss",
-                f"${revenue_impact['monthly_revenue_loss']:,.2f}",
-                delta=f"-${revenue_impact['monthly_revenue_loss']:,.2f}",
-                delta_color="inverse"
-            )
-            st.metric(
-                "Annual Loss",
-                f"${revenue_impact['annual_revenue_loss']:,.2f}",
-                delta=f"-${revenue_impact['annual_revenue_loss']:,.2f}",
-                delta_color="inverse"
-            )
+        # Current state (left) and potential loss (right), sent as one element
+        MetricsDisplay.render_metric_grid([
+            {'label': "Monthly Revenue", 'value': f"${revenue_impact['estimated_monthly_revenue']:,.2f}"},
+            {
+                'label': "Monthly Loss",
+                'value': f"${revenue_impact['monthly_revenue_loss']:,.2f}",
+                'delta': f"-${revenue_impact['monthly_revenue_loss']:,.2f}",
+                'delta_good': False
+            },
+            {'label': "Annual Revenue", 'value': f"${revenue_impact['estimated_monthly_revenue'] * 12:,.2f}"},
+            {
+                'label': "Annual Loss",
+                'value': f"${revenue_impact['annual_revenue_loss']:,.2f}",
+                'delta': f"-${revenue_impact['annual_revenue_loss']:,.2f}",
+                'delta_good': False
+            }
+        ])
         
         st.markdown("---")
         
         # Optimization Potential
         st.subheader("🚀 Optimization Potential")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.metric(
-                "Potential Monthly Gain",
-                f"${revenue_impact['potential_monthly_gain']:,.2f}",
-                delta=f"+${revenue_impact['potential_monthly_gain']:,.2f}"
-            )
-        
-        with col2:
-            st.metric(
-                "Potential Annual Gain",
-                f"${revenue_impact['potential_annual_gain']:,.2f}",
-                delta=f"+${revenue_impact['potential_annual_gain']:,.2f}"
-            )
+        MetricsDisplay.render_metric_grid([
+            {
+                'label': "Potential Monthly Gain",
+                'value': f"${revenue_impact['potential_monthly_gain']:,.2f}",
+                'delta': f"+${revenue_impact['potential_monthly_gain']:,.2f}"
+            },
+            {
+                'label': "Potential Annual Gain",
+                'value': f"${revenue_impact['potential_annual_gain']:,.2f}",
+                'delta': f"+${revenue_impact['potential_annual_gain']:,.2f}"
+            }
+        ])
         
         if revenue_impact['potential_monthly_gain'] > 0:
             st.success(f"💡 Reducing load time by 1 second could increase annual revenue by ${revenue_impact['potential_annual_gain']:,.2f}")
         
         st.markdown("---")
-        
-        # Industry Benchmarks
-        with st.expander("📊 Industry Benchmarks & Research"):
-            st.markdown("""
-            **Performance Impact on Business Metrics:**
-            
-            1. **Load Time Impact**
-               - 1 second delay = 7% reduction in conversions
-               - 100ms delay = 1% drop in sales (Amazon)
-               - 2 second delay = 87% bounce rate increase
-            
-            2. **Abandonment Rates by Load Time**
-               - 1 second: 7% abandon
-               - 2 seconds: 11% abandon
-               - 3 seconds: 16% abandon
-               - 5 seconds: 32% abandon
-               - 10 seconds: 53% abandon
-            
-            3. **Mobile Impact**
-               - 53% of mobile users abandon sites taking >3s to load
-               - Mobile conversion rates are 2x lower with 5s load time
-            
-            4. **Revenue Correlation**
-               - Every 100ms improvement = 1% revenue increase (Walmart)
-               - 0.1s improvement = 8% conversion increase (Mobify)
-            
-            **Sources:** Google, Amazon, Akamai, Kissmetrics research
-            """)
+
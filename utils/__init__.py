@@ -2,5 +2,6 @@
 
 from .logger import get_logger
 from .validators import validate_file_size, validate_har_content, validate_dataframe_schema
+from .display import widen_float32
 
-__all__ = ['get_logger', 'validate_file_size', 'validate_har_content', 'validate_dataframe_schema']
+__all__ = ['get_logger', 'validate_file_size', 'validate_har_content', 'validate_dataframe_schema', 'widen_float32']
@@ -0,0 +1,26 @@
+# utils/display.py - Preparing compact DataFrames for display and export
+
+import pandas as pd
+
+# Timings are stored as float32; digits past this are float32 rounding noise
+DISPLAY_DECIMALS = 3
+
+
+def widen_float32(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert float32 columns to float64 rounded to DISPLAY_DECIMALS.
+    
+    A value recorded as 18.63 is stored in float32 as 18.6299991..., which
+    tables and JSON show in full. Rounding after widening restores the
+    values as recorded in the HAR. Use at the display/export boundary only.
+    
+    Args:
+        df: DataFrame to display or export
+        
+    Returns:
+        DataFrame with float32 columns widened, or df itself if it has none
+    """
+    columns = [column for column, dtype in df.dtypes.items() if dtype == 'float32']
+    if not columns:
+        return df
+    return df.astype({column: 'float64' for column in columns}).round({column: DISPLAY_DECIMALS for column in columns})
@@ -1,7 +1,11 @@
 # utils/logger.py - Centralized logging configuration
 
+import atexit
 import logging
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 # Create logs directory if it doesn't exist
@@ -12,6 +16,47 @@ LOG_DIR.mkdir(exist_ok=True)
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# Log file rotation settings
+LOG_FILE_MAX_BYTES = 10_000_000
+LOG_FILE_BACKUP_COUNT = 3
+
+
+@lru_cache(maxsize=None)
+def _get_queue_handler() -> QueueHandler:
+    """
+    Get the process-wide queue handler shared by all loggers.
+    
+    Records are put on an in-memory queue and written to the console and
+    log file by a background listener thread, so log I/O stays off the
+    request path. The sink handlers are created once instead of per logger.
+    
+    Returns:
+        Queue handler feeding the background listener
+    """
+    formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+    
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    
+    # File handler
+    file_handler = RotatingFileHandler(
+        LOG_DIR / 'har_analyzer.log',
+        maxBytes=LOG_FILE_MAX_BYTES,
+        backupCount=LOG_FILE_BACKUP_COUNT
+    )
+    file_handler.setLevel(logging.DEBUG)  # Log everything to file
+    file_handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    return QueueHandler(log_queue)
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """
     Get a configured logger instance.
@@ -19,7 +64,7 @@ def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     Args:
         name: Logger name (typically __name__)
         level: Logging level (default: INFO)
-        
+    
     Returns:
         Configured logger instance
     """
@@ -30,19 +75,6 @@ def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
         return logger
     
     logger.setLevel(level)
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler
-    file_handler = logging.FileHandler(LOG_DIR / 'har_analyzer.log')
-    file_handler.setLevel(logging.DEBUG)  # Log everything to file
-    file_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    logger.addHandler(_get_queue_handler())
     
     return logger
@@ -1,7 +1,8 @@
 # utils/validators.py - Input validation utilities
 
+import re
 import pandas as pd
-from typing import Optional, List
+from typing import Optional, List, Union
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -16,6 +17,13 @@ REQUIRED_COLUMNS = [
     'blocked', 'dns', 'connect', 'send', 'wait', 'receive', 'ssl'
 ]
 
+# First non-whitespace character, matched in place without copying the content
+_FIRST_CHAR_STR = re.compile(r'\s*(\S)')
+_FIRST_CHAR_BYTES = re.compile(rb'\s*(\S)')
+
+# Index form of REQUIRED_COLUMNS for hashed schema checks
+_REQUIRED_COLUMNS_INDEX = pd.Index(REQUIRED_COLUMNS)
+
 
 def validate_file_size(file_size: int) -> tuple[bool, Optional[str]]:
     """
@@ -50,14 +58,15 @@ def validate_dataframe_schema(df: pd.DataFrame) -> tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if df is None or df.empty:
+    if df is None or len(df.index) == 0:
         error = "DataFrame is empty or None"
         logger.error(error)
         return False, error
     
-    missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    # One hashed index difference, keeping REQUIRED_COLUMNS order in the message
+    missing_columns = _REQUIRED_COLUMNS_INDEX.difference(df.columns, sort=False)
     
-    if missing_columns:
+    if len(missing_columns):
         error = f"Missing required columns: {', '.join(missing_columns)}"
         logger.error(error)
         return False, error
@@ -65,23 +74,29 @@ def validate_dataframe_schema(df: pd.DataFrame) -> tuple[bool, Optional[str]]:
     return True, None
 
 
-def validate_har_content(content: str) -> tuple[bool, Optional[str]]:
+def validate_har_content(content: Union[str, bytes]) -> tuple[bool, Optional[str]]:
     """
     Basic validation of HAR file content.
     
+    Only the leading whitespace and first character are inspected, so raw
+    upload bytes can be checked before decoding a multi-megabyte file.
+    
     Args:
-        content: HAR file content as string
+        content: HAR file content as string or raw bytes
         
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not content or not content.strip():
+    pattern = _FIRST_CHAR_BYTES if isinstance(content, bytes) else _FIRST_CHAR_STR
+    match = pattern.match(content) if content else None
+    
+    if match is None:
         error = "File content is empty"
         logger.warning(error)
         return False, error
     
     # Check if it looks like JSON
-    if not content.strip().startswith('{'):
+    if match.group(1) not in ('{', b'{'):
         error = "File does not appear to be valid JSON"
         logger.warning(error)
         return False, error
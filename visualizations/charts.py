@@ -1,10 +1,12 @@
 # visualizations/charts.py - Chart creation functions
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+from bisect import bisect_right
+from functools import lru_cache
+from analyzers.performance_analyzer import PerformanceAnalyzer
 from typing import Tuple, Optional, List, Dict, Any, Union
-import streamlit as st
 from config import (
     TIMING_PHASES,
     RESPONSE_TIME_HISTOGRAM_BINS,
@@ -12,180 +14,385 @@ from config import (
     COLOR_REDIRECT,
     COLOR_ERROR,
     COLOR_SCALE,
+    RESPONSE_TIME_PERCENTILES,
+    SCATTER_MAX_POINTS,
+    SCATTER_MIN_POINTS_PER_TYPE,
 )
 
 
-# Cache heavy chart configurations
-@st.cache_resource
-def get_chart_configurations():
-    """Get cached chart configurations."""
-    return {
-        'default_layout': {
-            'font': {'family': 'Arial, sans-serif', 'size': 12},
-            'margin': {'l': 50, 'r': 50, 't': 50, 'b': 50},
-            'paper_bgcolor': 'rgba(0,0,0,0)',
-            'plot_bgcolor': 'rgba(0,0,0,0)',
-        },
-        'performance_gauge_colors': {
-            'excellent': '#00CC96',
-            'good': '#FF6692',
-            'poor': '#B6E880',
-            'bad': '#FF97FF',
-        },
-        'status_colors': {
-            'success': COLOR_SUCCESS,
-            'redirect': COLOR_REDIRECT,
-            'error': COLOR_ERROR,
-        },
-        'percentile_colors': ['green', 'lightgreen', 'yellow', 'orange', 'red'],
-        'timing_colors': {
-            'blocked': '#FF6692',
-            'dns': '#FF97FF',
-            'connect': '#B6E880',
-            'send': '#19D3F3',
-            'wait': '#FF6692',
-            'receive': '#00CC96',
-            'ssl': '#FF6692',
-        }
+# Static chart configurations, shared by every chart as plain module constants
+_CHART_CONFIGS = {
+    'default_layout': {
+        'font': {'family': 'Arial, sans-serif', 'size': 12},
+        'margin': {'l': 50, 'r': 50, 't': 50, 'b': 50},
+        'paper_bgcolor': 'rgba(0,0,0,0)',
+        'plot_bgcolor': 'rgba(0,0,0,0)',
+    },
+    'performance_gauge_colors': {
+        'excellent': '#00CC96',
+        'good': '#FF6692',
+        'poor': '#B6E880',
+        'bad': '#FF97FF',
+    },
+    'status_colors': {
+        'success': COLOR_SUCCESS,
+        'redirect': COLOR_REDIRECT,
+        'error': COLOR_ERROR,
+    },
+    'percentile_colors': ['green', 'lightgreen', 'yellow', 'orange', 'red'],
+    'timing_colors': {
+        'blocked': '#FF6692',
+        'dns': '#FF97FF',
+        'connect': '#B6E880',
+        'send': '#19D3F3',
+        'wait': '#FF6692',
+        'receive': '#00CC96',
+        'ssl': '#FF6692',
     }
+}
 
+_CHART_TEMPLATES = {
+    'histogram_template': 'plotly_white',
+    'pie_template': 'plotly_white',
+    'bar_template': 'plotly_white',
+    'scatter_template': 'plotly_white',
+    'gauge_template': 'plotly_white',
+}
+
+# Base layouts (template plus default layout) built once per template. Figures
+# start from these, so the shared keys are not re-validated for every chart.
+_BASE_LAYOUTS = {
+    name: go.Layout(template=template, **_CHART_CONFIGS['default_layout'])
+    for name, template in _CHART_TEMPLATES.items()
+}
+
+# Gauge colors for scores below, between and above these thresholds
+_GAUGE_SCORE_THRESHOLDS = (60, 80)
+_GAUGE_COLORS = tuple(
+    _CHART_CONFIGS['performance_gauge_colors'][level] for level in ('bad', 'good', 'excellent')
+)
+
+# Percentile labels, in RESPONSE_TIME_PERCENTILES order
+_PERCENTILE_LABELS = ['P50', 'P75', 'P90', 'P95', 'P99']
 
-@st.cache_resource
-def get_chart_templates():
-    """Get cached chart templates."""
-    return {
-        'histogram_template': 'plotly_white',
-        'pie_template': 'plotly_white',
-        'bar_template': 'plotly_white',
-        'scatter_template': 'plotly_white',
-        'gauge_template': 'plotly_white',
-    }
+
+# Figure skeletons hold everything but the data for charts whose shape never
+# changes. They are shared across sessions and chart-building threads, so
+# callers copy them with go.Figure(skeleton) before setting any data.
+@lru_cache(maxsize=None)
+def _timing_breakdown_skeleton() -> go.Figure:
+    """Get the cached timing breakdown figure without bar heights."""
+    fig = go.Figure(go.Bar(
+        x=TIMING_PHASES,
+        marker_color=[_CHART_CONFIGS['timing_colors'].get(phase, '#7F7F7F') for phase in TIMING_PHASES],
+        hovertemplate="Timing Phase=%{x}<br>Time (ms)=%{y}<extra></extra>"
+    ), layout=_BASE_LAYOUTS['bar_template'])
+    
+    fig.update_layout(
+        title="Average Timing Breakdown",
+        xaxis_title="Timing Phase",
+        yaxis_title="Time (ms)",
+        showlegend=False
+    )
+    return fig
+
+
+@lru_cache(maxsize=None)
+def _percentile_skeleton() -> go.Figure:
+    """Get the cached percentile figure without bar heights or labels."""
+    fig = go.Figure(go.Bar(
+        x=_PERCENTILE_LABELS,
+        textposition='auto',
+        marker_color=_CHART_CONFIGS['percentile_colors']
+    ), layout=_BASE_LAYOUTS['bar_template'])
+    
+    fig.update_layout(
+        title="Response Time Percentiles",
+        xaxis_title="Percentile",
+        yaxis_title="Response Time (ms)",
+        showlegend=False
+    )
+    return fig
 
 
 class ChartFactory:
     """Factory for creating Plotly charts."""
     
     @staticmethod
-    def create_timing_breakdown_chart(df: pd.DataFrame, key: str = None) -> Tuple[go.Figure, str]:
-        """Create timing breakdown bar chart."""
-        configs = get_chart_configurations()
-        avg_timings = df[TIMING_PHASES].mean()
-        
-        # Create custom colors for each timing phase
-        colors = [configs['timing_colors'].get(phase, '#7F7F7F') for phase in avg_timings.index]
-        
-        fig = px.bar(
-            x=avg_timings.index,
-            y=avg_timings.values,
-            title="Average Timing Breakdown",
-            labels={'x': 'Timing Phase', 'y': 'Time (ms)'},
-            color=avg_timings.index,
-            color_discrete_map={phase: configs['timing_colors'].get(phase, '#7F7F7F') for phase in avg_timings.index}
+    def precompute_chart_inputs(df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Compute the aggregates behind the summary charts in one place.
+        
+        Charts that accept ``inputs`` read these instead of re-scanning the
+        DataFrame, so building several charts (or the same chart with
+        different limits) aggregates each column once.
+        
+        Args:
+            df: DataFrame with HAR entries
+            
+        Returns:
+            Dictionary with average timings, status counts, all endpoints
+            sorted slowest first, and response time percentiles
+        """
+        return {
+            'avg_timings': df[TIMING_PHASES].mean(),
+            'status_counts': ChartFactory._status_counts(df),
+            'endpoint_stats': PerformanceAnalyzer.get_slowest_endpoints(df, limit=len(df)),
+            'percentiles': ChartFactory._response_time_percentiles(df),
+        }
+    
+    @staticmethod
+    def _response_time_percentiles(df: pd.DataFrame) -> List[float]:
+        """Compute all response time percentiles with one NumPy quantile call."""
+        total_times = ChartFactory._to_np(df['total_time']).astype('float64', copy=False)
+        return np.quantile(total_times, RESPONSE_TIME_PERCENTILES).tolist()
+    
+    @staticmethod
+    def _status_counts(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Count requests per status code.
+        
+        Status codes are small non-negative integers, so one np.bincount
+        pass replaces the hash-based value_counts.
+        
+        Args:
+            df: DataFrame with HAR entries
+            
+        Returns:
+            DataFrame with 'status' and 'count' columns, most frequent first
+        """
+        statuses = df['status'].to_numpy()
+        if len(statuses) == 0 or statuses.min() < 0:
+            status_counts = df['status'].value_counts()
+            return pd.DataFrame({'status': status_counts.index, 'count': status_counts.to_numpy()})
+        
+        counts = np.bincount(statuses, minlength=600)
+        present = np.flatnonzero(counts)
+        order = np.argsort(-counts[present], kind='stable')
+        return pd.DataFrame({
+            'status': present[order].astype(statuses.dtype),
+            'count': counts[present][order]
+        })
+    
+    @staticmethod
+    def _to_np(series: pd.Series) -> np.ndarray:
+        """
+        Get a column's values as a NumPy array, without copying where possible.
+        
+        Arrow-backed numeric columns without nulls are viewed through
+        pyarrow's zero-copy conversion (only multi-chunk columns are
+        combined first). Everything else goes through ``to_numpy``.
+        
+        Args:
+            series: Column to convert
+            
+        Returns:
+            NumPy array of the column values
+        """
+        dtype = series.dtype
+        if isinstance(dtype, pd.ArrowDtype) and dtype.kind in 'iuf':
+            chunked = series.array.__arrow_array__()
+            if chunked.null_count == 0:
+                values = chunked.chunk(0) if chunked.num_chunks == 1 else chunked.combine_chunks()
+                return values.to_numpy(zero_copy_only=True)
+        return series.to_numpy()
+    
+    @staticmethod
+    def _typed_column(series: pd.Series) -> pd.Series:
+        """
+        Ensure a plotted column has a numeric dtype.
+        
+        Plotly serializes numeric NumPy arrays as base64 typed arrays, while
+        object columns are sent as JSON lists of Python values. Coerced
+        columns are downcast to float32, matching the dtypes the parser
+        produces, so the encoded arrays stay at four bytes per value.
+        
+        Args:
+            series: Column to plot
+            
+        Returns:
+            The column itself if already numeric, otherwise a float32 copy
+        """
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            return series
+        return pd.to_numeric(series, errors='coerce', downcast='float')
+    
+    @staticmethod
+    def _sample_positions(groups: pd.Series, max_points: int = SCATTER_MAX_POINTS) -> Optional[np.ndarray]:
+        """
+        Pick a deterministic, group-stratified sample of row positions.
+        
+        Each group keeps its share of ``max_points`` (at least
+        SCATTER_MIN_POINTS_PER_TYPE rows, or all of them if fewer), so small
+        resource types stay visible while the total marker count is bounded.
+        The sample has exactly ``max_points`` rows unless the per-group
+        minimums alone add up to more.
+        
+        Args:
+            groups: Categorical Series assigning each row to a group
+            max_points: Number of rows to keep
+            
+        Returns:
+            Sorted row positions to keep, or None if no sampling is needed
+        """
+        total = len(groups)
+        if total <= max_points:
+            return None
+        
+        codes = groups.cat.codes.to_numpy()
+        
+        # Shuffle once with a fixed seed, then stable-sort by group so each
+        # group's rows appear in random order and its head is a random sample
+        order = np.random.default_rng(0).permutation(total)
+        order = order[np.argsort(codes[order], kind='stable')]
+        
+        group_codes, group_starts, group_sizes = np.unique(
+            codes[order], return_index=True, return_counts=True
         )
-        
-        fig.update_layout(
-            showlegend=False,
-            template=get_chart_templates()['bar_template'],
-            **configs['default_layout']
+        quotas = np.minimum(
+            group_sizes,
+            np.maximum(SCATTER_MIN_POINTS_PER_TYPE, max_points * group_sizes // total)
         )
+        
+        # Flooring the shares and raising small groups to the minimum make the
+        # total drift from max_points. Hand missing points to the groups with
+        # the largest remainders that have rows to spare, and take extra ones
+        # from the largest groups without going below their minimum.
+        difference = max_points - quotas.sum()
+        if difference > 0:
+            remainders = max_points * group_sizes % total
+            spare = np.flatnonzero(group_sizes > quotas)
+            spare = spare[np.argsort(-remainders[spare], kind='stable')]
+            quotas[spare[:difference]] += 1
+        elif difference < 0:
+            minimums = np.minimum(group_sizes, SCATTER_MIN_POINTS_PER_TYPE)
+            for group in np.argsort(-quotas, kind='stable'):
+                take = min(-difference, quotas[group] - minimums[group])
+                quotas[group] -= take
+                difference += take
+                if difference == 0:
+                    break
+        
+        keep = np.concatenate([
+            order[start:start + quota] for start, quota in zip(group_starts, quotas)
+        ])
+        return np.sort(keep)
+    
+    @staticmethod
+    def _vline_layout(x: float, text: str) -> Dict[str, List[Dict]]:
+        """
+        Build layout entries for a dashed red vertical threshold line.
+        
+        Equivalent to ``fig.add_vline``, but returned as layout kwargs so the
+        line is applied in the chart's single ``update_layout`` call.
+        
+        Args:
+            x: Position of the line on the x axis
+            text: Annotation shown at the top of the line
+            
+        Returns:
+            Dictionary with 'shapes' and 'annotations' layout entries
+        """
+        return {
+            'shapes': [{
+                'type': 'line', 'xref': 'x', 'yref': 'y domain',
+                'x0': x, 'x1': x, 'y0': 0, 'y1': 1,
+                'line': {'color': 'red', 'dash': 'dash'},
+            }],
+            'annotations': [{
+                'text': text, 'showarrow': False,
+                'xref': 'x', 'yref': 'y domain', 'x': x, 'y': 1,
+                'xanchor': 'left', 'yanchor': 'top',
+            }],
+        }
+    
+    @staticmethod
+    def create_timing_breakdown_chart(df: pd.DataFrame, key: str = None, inputs: Optional[Dict[str, Any]] = None) -> Tuple[go.Figure, str]:
+        """Create timing breakdown bar chart."""
+        avg_timings = inputs['avg_timings'] if inputs else df[TIMING_PHASES].mean()
+        
+        # Only the bar heights change between HAR files
+        fig = go.Figure(_timing_breakdown_skeleton())
+        fig.update_traces(y=avg_timings[TIMING_PHASES].to_numpy())
         return fig, key or "timing_breakdown"
     
     @staticmethod
     def create_response_time_histogram(df: pd.DataFrame, key: str = None) -> Tuple[go.Figure, str]:
         """Create response time distribution histogram."""
-        configs = get_chart_configurations()
-        templates = get_chart_templates()
-        
-        fig = px.histogram(
-            df,
-            x='total_time',
-            title="Response Time Distribution",
-            labels={
-                'total_time': 'Response Time (ms)',
-                'count': 'Number of Requests'
-            },
-            nbins=RESPONSE_TIME_HISTOGRAM_BINS,
-            template=templates['histogram_template']
+        # Bin server-side so only the bin counts are sent to the browser
+        counts, edges = np.histogram(
+            ChartFactory._to_np(df['total_time']),
+            bins=RESPONSE_TIME_HISTOGRAM_BINS
         )
         
-        # Add vertical line for 1000ms threshold
-        fig.add_vline(
-            x=1000,
-            line_dash="dash",
-            line_color="red",
-            annotation_text="1000ms threshold"
-        )
+        fig = go.Figure(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            customdata=np.column_stack((edges[:-1], edges[1:])),
+            hovertemplate=(
+                "Response Time (ms)=%{customdata[0]:.0f}-%{customdata[1]:.0f}"
+                "<br>count=%{y}<extra></extra>"
+            )
+        ), layout=_BASE_LAYOUTS['histogram_template'])
         
-        fig.update_layout(**configs['default_layout'])
+        # Vertical line for the 1000ms threshold, applied with the layout
+        fig.update_layout(
+            title="Response Time Distribution",
+            xaxis_title="Response Time (ms)",
+            yaxis_title="count",
+            bargap=0,
+            **ChartFactory._vline_layout(1000, "1000ms threshold")
+        )
         return fig, key or "response_time_histogram"
     
     @staticmethod
-    def create_status_code_chart(df: pd.DataFrame, key: str = None) -> Tuple[go.Figure, str]:
+    def create_status_code_chart(df: pd.DataFrame, key: str = None, inputs: Optional[Dict[str, Any]] = None) -> Tuple[go.Figure, str]:
         """Create status code distribution pie chart."""
-        configs = get_chart_configurations()
-        templates = get_chart_templates()
-        
-        status_counts = df['status'].value_counts().reset_index()
-        status_counts.columns = ['status', 'count']
-        
-        # Color code based on status ranges
-        colors = []
-        for status in status_counts['status']:
-            if status < 300:
-                colors.append(configs['status_colors']['success'])
-            elif status < 400:
-                colors.append(configs['status_colors']['redirect'])
-            else:
-                colors.append(configs['status_colors']['error'])
-        
-        fig = px.pie(
-            status_counts,
-            values='count',
-            names='status',
-            title="Status Code Distribution",
-            color_discrete_sequence=colors,
-            template=templates['pie_template']
+        status_counts = inputs['status_counts'] if inputs else ChartFactory._status_counts(df)
+        
+        # Color code based on status ranges (<300, 3xx, >=400)
+        status_colors = _CHART_CONFIGS['status_colors']
+        statuses = status_counts['status'].to_numpy()
+        colors = np.where(
+            statuses < 300,
+            status_colors['success'],
+            np.where(statuses < 400, status_colors['redirect'], status_colors['error'])
         )
         
-        fig.update_layout(**configs['default_layout'])
+        fig = go.Figure(go.Pie(
+            labels=statuses,
+            values=status_counts['count'].to_numpy(),
+            marker_colors=colors,
+            hovertemplate="status=%{label}<br>count=%{value}<extra></extra>"
+        ), layout=_BASE_LAYOUTS['pie_template'])
+        
+        fig.update_layout(title="Status Code Distribution")
         return fig, key or "status_code_chart"
     
     @staticmethod
-    def create_slowest_endpoints_chart(df: pd.DataFrame, limit: int = 10, key: str = None) -> Tuple[go.Figure, str]:
+    def create_slowest_endpoints_chart(df: pd.DataFrame, limit: int = 10, key: str = None, inputs: Optional[Dict[str, Any]] = None) -> Tuple[go.Figure, str]:
         """Create chart showing slowest endpoints."""
-        configs = get_chart_configurations()
-        templates = get_chart_templates()
-        
-        endpoint_stats = df.groupby('endpoint').agg({
-            'total_time': ['mean', 'count']
-        }).round(2)
-        
-        endpoint_stats.columns = ['avg_response_time', 'request_count']
-        endpoint_stats = endpoint_stats.reset_index()
-        endpoint_stats = endpoint_stats[endpoint_stats['request_count'] >= 1]
-        endpoint_stats = endpoint_stats.sort_values(
-            'avg_response_time',
-            ascending=False
-        ).head(limit)
-        
-        fig = px.bar(
-            endpoint_stats,
-            x='avg_response_time',
-            y='endpoint',
+        if inputs:
+            endpoint_stats = inputs['endpoint_stats'].head(limit)
+        else:
+            endpoint_stats = PerformanceAnalyzer.get_slowest_endpoints(df, limit=limit)
+        
+        avg_response_times = endpoint_stats['avg_response_time'].to_numpy()
+        
+        fig = go.Figure(go.Bar(
+            x=avg_response_times,
+            y=endpoint_stats['endpoint'].to_numpy(),
             orientation='h',
-            title="Top 10 Slowest Endpoints",
-            labels={
-                'avg_response_time': 'Average Response Time (ms)',
-                'endpoint': 'Endpoint'
-            },
-            color='avg_response_time',
-            color_continuous_scale=COLOR_SCALE,
-            template=templates['bar_template']
-        )
+            marker={'color': avg_response_times, 'coloraxis': 'coloraxis'},
+            hovertemplate="Average Response Time (ms)=%{marker.color}<br>Endpoint=%{y}<extra></extra>"
+        ), layout=_BASE_LAYOUTS['bar_template'])
         
         fig.update_layout(
-            yaxis={'categoryorder': 'total ascending'},
-            **configs['default_layout']
+            title="Top 10 Slowest Endpoints",
+            xaxis_title="Average Response Time (ms)",
+            yaxis={'title': {'text': 'Endpoint'}, 'categoryorder': 'total ascending'},
+            coloraxis={'colorscale': COLOR_SCALE, 'colorbar': {'title': {'text': 'Average Response Time (ms)'}}}
         )
         return fig, key or "slowest_endpoints_chart"
     
@@ -195,31 +402,26 @@ class ChartFactory:
         if domain_stats.empty:
             return None, None
         
-        configs = get_chart_configurations()
-        templates = get_chart_templates()
-        
         # Take top 15 domains by total time
         top_domains = domain_stats.head(15)
         
-        fig = px.bar(
-            top_domains,
-            x='total_time_sum',
-            y='domain',
+        fig = go.Figure(go.Bar(
+            x=top_domains['total_time_sum'].to_numpy(),
+            y=top_domains['domain'].to_numpy(),
             orientation='h',
-            title="Domain Performance Impact",
-            labels={
-                'total_time_sum': 'Total Time (ms)',
-                'domain': 'Domain'
-            },
-            color='time_percentage',
-            color_continuous_scale=COLOR_SCALE,
-            hover_data=['request_count', 'avg_time'],
-            template=templates['bar_template']
-        )
+            marker={'color': top_domains['time_percentage'].to_numpy(), 'coloraxis': 'coloraxis'},
+            customdata=top_domains[['request_count', 'avg_time']].to_numpy(dtype='float64'),
+            hovertemplate=(
+                "Total Time (ms)=%{x}<br>Domain=%{y}<br>request_count=%{customdata[0]}"
+                "<br>avg_time=%{customdata[1]}<br>time_percentage=%{marker.color}<extra></extra>"
+            )
+        ), layout=_BASE_LAYOUTS['bar_template'])
         
         fig.update_layout(
-            yaxis={'categoryorder': 'total ascending'},
-            **configs['default_layout']
+            title="Domain Performance Impact",
+            xaxis_title="Total Time (ms)",
+            yaxis={'title': {'text': 'Domain'}, 'categoryorder': 'total ascending'},
+            coloraxis={'colorscale': COLOR_SCALE, 'colorbar': {'title': {'text': 'time_percentage'}}}
         )
         return fig, key or "domain_performance_chart"
     
@@ -229,39 +431,23 @@ class ChartFactory:
         if resource_stats.empty:
             return None, None
         
-        configs = get_chart_configurations()
-        templates = get_chart_templates()
-        
-        fig = px.pie(
-            resource_stats,
-            values='total_size',
-            names='resource_type',
-            title="Resource Size Distribution by Type",
+        fig = go.Figure(go.Pie(
+            labels=resource_stats['resource_type'].to_numpy(),
+            values=resource_stats['total_size'].to_numpy(),
             hole=0.3,
-            template=templates['pie_template']
-        )
-        
-        fig.update_traces(
             textposition='inside',
-            textinfo='percent+label'
-        )
+            textinfo='percent+label',
+            hovertemplate="resource_type=%{label}<br>total_size=%{value}<extra></extra>"
+        ), layout=_BASE_LAYOUTS['pie_template'])
         
-        fig.update_layout(**configs['default_layout'])
+        fig.update_layout(title="Resource Size Distribution by Type")
         return fig, key or "resource_size_chart"
     
     @staticmethod
     def create_performance_score_gauge(score: int, grade: str, key: str = None) -> Tuple[go.Figure, str]:
         """Create performance score gauge chart."""
-        configs = get_chart_configurations()
-        templates = get_chart_templates()
-        
-        # Determine color based on score
-        if score >= 80:
-            color = configs['performance_gauge_colors']['excellent']
-        elif score >= 60:
-            color = configs['performance_gauge_colors']['good']
-        else:
-            color = configs['performance_gauge_colors']['bad']
+        # Determine color based on score: <60, 60-79, >=80
+        color = _GAUGE_COLORS[bisect_right(_GAUGE_SCORE_THRESHOLDS, score)]
         
         fig = go.Figure(go.Indicator(
             mode="gauge+number+delta",
@@ -283,73 +469,117 @@ class ChartFactory:
                     'value': 90
                 }
             }
-        ))
+        ), layout=_BASE_LAYOUTS['gauge_template'])
         
-        fig.update_layout(
-            height=300,
-            template=templates['gauge_template'],
-            **configs['default_layout']
-        )
+        fig.update_layout(height=300)
         return fig, key or "performance_score_gauge"
     
     @staticmethod
-    def create_percentile_chart(df: pd.DataFrame, key: str = None) -> Tuple[go.Figure, str]:
-        """Create percentile analysis chart."""
-        configs = get_chart_configurations()
-        templates = get_chart_templates()
-        
-        percentiles = [0.5, 0.75, 0.9, 0.95, 0.99]
-        percentile_values = [df['total_time'].quantile(p) for p in percentiles]
-        percentile_labels = ['P50', 'P75', 'P90', 'P95', 'P99']
-        
+    def create_protocol_chart(https_count: int, http_count: int, key: str = None) -> Tuple[go.Figure, str]:
+        """Create HTTP vs HTTPS request distribution pie chart."""
         fig = go.Figure(data=[
-            go.Bar(
-                x=percentile_labels,
-                y=percentile_values,
-                text=[f"{v:.0f}ms" for v in percentile_values],
-                textposition='auto',
-                marker_color=configs['percentile_colors']
+            go.Pie(
+                labels=['HTTPS', 'HTTP'],
+                values=[https_count, http_count],
+                marker_colors=['green', 'red']
             )
         ])
         
+        fig.update_layout(title="HTTP vs HTTPS Requests")
+        return fig, key or "protocol_chart"
+    
+    @staticmethod
+    def create_budget_utilization_chart(utilization: Dict[str, Dict], key: str = None) -> Tuple[Optional[go.Figure], Optional[str]]:
+        """Create horizontal bar chart of budget utilization per metric."""
+        if not utilization:
+            return None, None
+        
+        labels = [name.replace('_', ' ').title() for name in utilization]
+        values = [data['utilization'] for data in utilization.values()]
+        
+        # Green within 80% of budget, yellow up to 100%, red over budget
+        colors = [
+            COLOR_SUCCESS if value <= 80 else COLOR_REDIRECT if value <= 100 else COLOR_ERROR
+            for value in values
+        ]
+        
+        fig = go.Figure(go.Bar(
+            x=values,
+            y=labels,
+            orientation='h',
+            marker_color=colors,
+            text=[f"{value:.0f}%" for value in values],
+            textposition='auto',
+            customdata=[[data['current'], data['budget']] for data in utilization.values()],
+            hovertemplate="%{y}: %{customdata[0]} / %{customdata[1]}<extra></extra>"
+        ), layout=_BASE_LAYOUTS['bar_template'])
+        
         fig.update_layout(
-            title="Response Time Percentiles",
-            xaxis_title="Percentile",
-            yaxis_title="Response Time (ms)",
+            title="Budget Utilization",
+            xaxis_title="Utilization (%)",
+            yaxis={'autorange': 'reversed'},
             showlegend=False,
-            template=templates['bar_template'],
-            **configs['default_layout']
+            **ChartFactory._vline_layout(100, "Budget")
         )
+        return fig, key or "budget_utilization_chart"
+    
+    @staticmethod
+    def create_percentile_chart(df: pd.DataFrame, key: str = None, inputs: Optional[Dict[str, Any]] = None) -> Tuple[go.Figure, str]:
+        """Create percentile analysis chart."""
+        if inputs:
+            percentile_values = inputs['percentiles']
+        else:
+            percentile_values = ChartFactory._response_time_percentiles(df)
         
+        # Only the bar heights and their labels change between HAR files
+        fig = go.Figure(_percentile_skeleton())
+        fig.update_traces(
+            y=np.asarray(percentile_values, dtype='float64'),
+            text=[f"{v:.0f}ms" for v in percentile_values]
+        )
         return fig, key or "percentile_chart"
     
     @staticmethod
     def create_size_vs_time_scatter(df: pd.DataFrame, key: str = None) -> Tuple[go.Figure, str]:
         """Create scatter plot of resource size vs load time."""
+        # Imported here: plotly.express is only needed by this chart and adds
+        # noticeable import time to app startup
+        import plotly.express as px
+        
         # Add resource type for coloring
         from analyzers.resource_analyzer import ResourceAnalyzer
         
-        configs = get_chart_configurations()
-        templates = get_chart_templates()
-        
-        df_plot = df.copy()
-        df_plot['resource_type'] = df_plot['mime_type'].apply(
-            ResourceAnalyzer.classify_resource_type
-        )
+        resource_type_column = ResourceAnalyzer.classify_resource_types(df['mime_type'])
+        resource_types = resource_type_column.to_numpy()
+        sizes = ChartFactory._to_np(ChartFactory._typed_column(df['response_size']))
+        times = ChartFactory._to_np(ChartFactory._typed_column(df['total_time']))
+        urls = df['url'].to_numpy()
+        title = "Resource Size vs Load Time Correlation"
+        
+        # Large HARs are plotted from a stratified sample to bound marker count
+        positions = ChartFactory._sample_positions(resource_type_column)
+        if positions is not None:
+            sizes, times, urls, resource_types = (
+                sizes[positions], times[positions], urls[positions], resource_types[positions]
+            )
+            title += f" (sample of {len(positions):,} / {len(df):,} requests)"
         
+        # Pass column arrays directly so no intermediate frame is copied;
+        # only the resource type column is materialized
         fig = px.scatter(
-            df_plot,
-            x='response_size',
-            y='total_time',
-            color='resource_type',
-            title="Resource Size vs Load Time Correlation",
+            x=sizes,
+            y=times,
+            color=resource_types,
+            title=title,
             labels={
-                'response_size': 'Resource Size (bytes)',
-                'total_time': 'Load Time (ms)'
+                'x': 'Resource Size (bytes)',
+                'y': 'Load Time (ms)',
+                'color': 'resource_type'
             },
-            hover_data=['url'],
-            template=templates['scatter_template']
+            hover_data={'url': urls},
+            render_mode='webgl',
+            template=_CHART_TEMPLATES['scatter_template']
         )
         
-        fig.update_layout(**configs['default_layout'])
+        fig.update_layout(**_CHART_CONFIGS['default_layout'])
         return fig, key or "size_vs_time_scatter"
@@ -1,10 +1,48 @@
 # visualizations/waterfall.py - Request waterfall visualization
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime
 from typing import Dict, List, Tuple
 from analyzers.resource_analyzer import ResourceAnalyzer
+from utils.logger import get_logger
+from utils.display import widen_float32
+from config import WATERFALL_WEBGL_MIN_BARS
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Request rows from top to bottom, one tick per request
+_REQUEST_YAXIS = dict(
+    tickmode='linear',
+    tick0=0,
+    dtick=1,
+    autorange='reversed'
+)
+
+# Layouts validated once at import; each chart only sets its height
+_WATERFALL_LAYOUT = go.Layout(
+    title="Request Waterfall Timeline",
+    xaxis=dict(title="Time (ms)"),
+    yaxis=dict(title="Request", **_REQUEST_YAXIS),
+    barmode='overlay',
+    hovermode='closest',
+    showlegend=True,
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1
+    )
+)
+_SIMPLIFIED_WATERFALL_LAYOUT = go.Layout(
+    title="Simplified Request Timeline",
+    xaxis=dict(title="Time (ms)"),
+    yaxis=dict(title="Request #", **_REQUEST_YAXIS),
+    hovermode='closest'
+)
 
 
 class WaterfallChart:
@@ -21,6 +59,17 @@ class WaterfallChart:
         'receive': '#00BCD4'   # Cyan
     }
     
+    # Color scheme for resource types
+    RESOURCE_COLORS = {
+        'JavaScript': '#FFC107',
+        'CSS': '#2196F3',
+        'Images': '#4CAF50',
+        'HTML': '#9C27B0',
+        'Fonts': '#FF5722',
+        'JSON': '#00BCD4',
+        'Other': '#9E9E9E'
+    }
+    
     @staticmethod
     def create_waterfall(df: pd.DataFrame, max_requests: int = 100) -> Tuple[go.Figure, str]:
         """
@@ -36,74 +85,148 @@ class WaterfallChart:
         if df.empty:
             return None, None
         
+        phases = ['blocked', 'dns', 'connect', 'ssl', 'send', 'wait', 'receive']
+        
         # Limit requests for performance
-        display_df = df.head(max_requests).copy()
+        display_df = WaterfallChart._display_frame(df, max_requests, ['endpoint', 'total_time'] + phases)
+        
+        # HARs without phase timings have nothing to break down; show total times instead
+        if not (display_df[phases].to_numpy() > 0).any():
+            return WaterfallChart.create_simplified_waterfall(df, max_requests=max_requests)
         
         # Parse start times and calculate relative times
         display_df = WaterfallChart._calculate_relative_times(display_df)
         
-        # Create figure
-        fig = go.Figure()
+        # Each phase starts where the request's previous non-empty phases end.
+        # Phase timings are stored as float32, so keep them in one float32 block.
+        durations = display_df[phases].to_numpy(dtype='float32')
+        elapsed = np.where(durations > 0, durations, np.float32(0))
+        starts = display_df['relative_start'].to_numpy(dtype='float64')
+        bases = starts[:, None] + np.cumsum(elapsed, axis=1) - elapsed
         
-        # Add bars for each timing phase
-        phases = ['blocked', 'dns', 'connect', 'ssl', 'send', 'wait', 'receive']
+        rows = display_df.index.to_numpy()
+        endpoints = WaterfallChart._short_endpoints(display_df)
+        totals = display_df['total_time'].to_numpy()
+        
+        # Many bar segments render slowly as SVG; draw them as WebGL line
+        # segments instead, one thick line per bar
+        use_webgl = np.count_nonzero(durations > 0) > WATERFALL_WEBGL_MIN_BARS
         
-        for idx, row in display_df.iterrows():
-            current_time = row['relative_start']
+        # One trace per phase holding all of that phase's bar segments. Traces
+        # are plain dicts passed to the figure constructor together with the
+        # layout, which is much cheaper than adding go.Bar objects one at a
+        # time and updating the layout afterwards.
+        traces = []
+        for col, phase in enumerate(phases):
+            mask = durations[:, col] > 0
+            if not mask.any():
+                continue
             
-            # Add each timing phase as a separate bar segment
-            for phase in phases:
-                if row[phase] > 0:
-                    # Create hover text
-                    hover_text = (
-                        f"<b>{row['endpoint'][:50]}</b><br>"
-                        f"Phase: {phase.upper()}<br>"
-                        f"Duration: {row[phase]:.1f}ms<br>"
-                        f"Start: {current_time:.1f}ms<br>"
-                        f"Total: {row['total_time']:.1f}ms"
-                    )
-                    
-                    fig.add_trace(go.Bar(
-                        name=phase,
-                        x=[row[phase]],
-                        y=[idx],
-                        orientation='h',
-                        marker=dict(color=WaterfallChart.PHASE_COLORS.get(phase, '#000000')),
-                        hovertemplate=hover_text + '<extra></extra>',
-                        showlegend=(idx == 0),  # Only show legend for first request
-                        base=current_time,
-                        width=0.8
-                    ))
-                    
-                    current_time += row[phase]
-        
-        # Update layout
-        fig.update_layout(
-            title="Request Waterfall Timeline",
-            xaxis_title="Time (ms)",
-            yaxis_title="Request",
-            barmode='overlay',
-            height=max(600, len(display_df) * 25),
-            hovermode='closest',
-            showlegend=True,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
+            if use_webgl:
+                traces.append(WaterfallChart._phase_segments_trace(
+                    phase, rows[mask], bases[mask, col], durations[mask, col],
+                    endpoints[mask], totals[mask]
+                ))
+                continue
+            
+            traces.append(dict(
+                type='bar',
+                name=phase,
+                legendgroup=phase,
+                x=durations[mask, col],
+                y=rows[mask],
+                orientation='h',
+                marker=dict(color=WaterfallChart.PHASE_COLORS.get(phase, '#000000')),
+                # Hover values are formatted by Plotly.js from the bar data,
+                # not by one Python f-string per bar
+                customdata=np.column_stack((endpoints[mask], bases[mask, col], totals[mask])),
+                hovertemplate=(
+                    f"<b>%{{customdata[0]}}</b><br>"
+                    f"Phase: {phase.upper()}<br>"
+                    "Duration: %{x:.1f}ms<br>"
+                    "Start: %{customdata[1]:.1f}ms<br>"
+                    "Total: %{customdata[2]:.1f}ms<extra></extra>"
+                ),
+                base=bases[mask, col],
+                width=0.8
+            ))
+        
+        fig = go.Figure(data=traces, layout=_WATERFALL_LAYOUT)
+        fig.layout.height = max(600, len(display_df) * 25)
+        
+        return fig, "waterfall_chart"
+    
+    @staticmethod
+    def _phase_segments_trace(phase: str, rows: np.ndarray, bases: np.ndarray, durations: np.ndarray,
+                              endpoints: np.ndarray, totals: np.ndarray) -> Dict:
+        """
+        Build a WebGL trace drawing one timing phase as horizontal segments.
+        
+        Each bar becomes a thick line from its start to its end, with a
+        NaN gap separating consecutive bars.
+        
+        Args:
+            phase: Timing phase name
+            rows: Request row of each segment
+            bases: Segment start times in ms
+            durations: Segment durations in ms
+            endpoints: Endpoint label of each segment
+            totals: Total time of each segment's request
+            
+        Returns:
+            Scattergl trace as a plain dict
+        """
+        gaps = np.full(len(rows), np.nan)
+        
+        return dict(
+            type='scattergl',
+            mode='lines',
+            name=phase,
+            legendgroup=phase,
+            x=np.column_stack((bases, bases + durations, gaps)).ravel(),
+            y=np.column_stack((rows, rows, gaps)).ravel(),
+            line=dict(color=WaterfallChart.PHASE_COLORS.get(phase, '#000000'), width=20),
+            customdata=np.repeat(np.column_stack((endpoints, bases, totals, durations)), 3, axis=0),
+            hovertemplate=(
+                f"<b>%{{customdata[0]}}</b><br>"
+                f"Phase: {phase.upper()}<br>"
+                "Duration: %{customdata[3]:.1f}ms<br>"
+                "Start: %{customdata[1]:.1f}ms<br>"
+                "Total: %{customdata[2]:.1f}ms<extra></extra>"
             )
         )
+    
+    @staticmethod
+    def _display_frame(df: pd.DataFrame, max_requests: int, columns: List[str]) -> pd.DataFrame:
+        """
+        Get the first requests with only the columns a chart reads.
         
-        # Update y-axis to show request numbers
-        fig.update_yaxes(
-            tickmode='linear',
-            tick0=0,
-            dtick=1,
-            autorange='reversed'
-        )
+        Selecting columns copies just those columns, so derived columns can
+        be added without copying the whole frame or touching the caller's.
         
-        return fig, "waterfall_chart"
+        Args:
+            df: DataFrame with HAR entries
+            max_requests: Maximum number of requests to keep
+            columns: Columns the chart reads
+            
+        Returns:
+            DataFrame with the selected rows and columns
+        """
+        time_columns = [c for c in ('start_time', 'started_datetime') if c in df.columns]
+        display_df = df.head(max_requests)[columns + time_columns]
+        
+        # Row slices of categorical columns keep every category of the full
+        # HAR; drop the unused ones so per-category work (string conversion,
+        # classification) only covers the displayed requests
+        for column in display_df.select_dtypes('category').columns:
+            display_df[column] = display_df[column].cat.remove_unused_categories()
+        
+        return display_df
+    
+    @staticmethod
+    def _short_endpoints(display_df: pd.DataFrame) -> np.ndarray:
+        """Endpoint labels truncated to 50 characters for hover text."""
+        return display_df['endpoint'].astype(str).str.slice(0, 50).to_numpy()
     
     @staticmethod
     def _calculate_relative_times(df: pd.DataFrame) -> pd.DataFrame:
@@ -119,11 +242,12 @@ class WaterfallChart:
         # Try to parse startedDateTime if available
         if 'started_datetime' in df.columns:
             try:
-                df['start_time'] = pd.to_datetime(df['started_datetime'])
+                df['start_time'] = WaterfallChart._start_times(df)
                 first_start = df['start_time'].min()
                 df['relative_start'] = (df['start_time'] - first_start).dt.total_seconds() * 1000
-            except:
+            except (ValueError, TypeError) as e:
                 # Fallback: use sequential ordering
+                logger.debug(f"Could not parse request start times: {str(e)}")
                 df['relative_start'] = 0
         else:
             # Fallback: use sequential ordering
@@ -131,6 +255,26 @@ class WaterfallChart:
         
         return df
     
+    @staticmethod
+    def _start_times(df: pd.DataFrame) -> pd.Series:
+        """
+        Get parsed request start times.
+        
+        Reuses an already parsed 'start_time' column so the startedDateTime
+        strings are only parsed once per frame.
+        
+        Args:
+            df: DataFrame with HAR entries
+            
+        Returns:
+            Series of request start datetimes
+        """
+        if 'start_time' in df.columns:
+            return df['start_time']
+        # startedDateTime is always ISO 8601; naming the format skips format
+        # inference, and utc=True accepts entries with different UTC offsets
+        return pd.to_datetime(df['started_datetime'], format='ISO8601', utc=True)
+    
     @staticmethod
     def create_simplified_waterfall(df: pd.DataFrame, max_requests: int = 50) -> Tuple[go.Figure, str]:
         """
@@ -147,68 +291,57 @@ class WaterfallChart:
             return None, None
         
         # Limit requests
-        display_df = df.head(max_requests).copy()
+        display_df = WaterfallChart._display_frame(
+            df, max_requests, ['endpoint', 'total_time', 'status', 'mime_type']
+        )
         
         # Calculate relative times
         display_df = WaterfallChart._calculate_relative_times(display_df)
         
         # Add resource type for coloring
-        display_df['resource_type'] = display_df['mime_type'].apply(
-            ResourceAnalyzer.classify_resource_type
-        )
+        display_df['resource_type'] = ResourceAnalyzer.classify_resource_types(display_df['mime_type'])
         
-        # Create figure
-        fig = go.Figure()
-        
-        # Color map for resource types
-        color_map = {
-            'JavaScript': '#FFC107',
-            'CSS': '#2196F3',
-            'Images': '#4CAF50',
-            'HTML': '#9C27B0',
-            'Fonts': '#FF5722',
-            'JSON': '#00BCD4',
-            'Other': '#9E9E9E'
-        }
-        
-        for idx, row in display_df.iterrows():
-            color = color_map.get(row['resource_type'], '#9E9E9E')
-            
-            hover_text = (
-                f"<b>{row['endpoint'][:50]}</b><br>"
-                f"Type: {row['resource_type']}<br>"
-                f"Duration: {row['total_time']:.1f}ms<br>"
-                f"Start: {row['relative_start']:.1f}ms<br>"
-                f"Status: {row['status']}"
-            )
-            
-            fig.add_trace(go.Bar(
-                x=[row['total_time']],
-                y=[idx],
-                orientation='h',
-                marker=dict(color=color),
-                hovertemplate=hover_text + '<extra></extra>',
-                showlegend=False,
-                base=row['relative_start'],
-                width=0.8
-            ))
+        # Bar colors for the whole column at once
+        colors = (
+            display_df['resource_type']
+            .map(WaterfallChart.RESOURCE_COLORS)
+            .astype(object)
+            .fillna('#9E9E9E')
+        )
         
-        # Update layout
-        fig.update_layout(
-            title="Simplified Request Timeline",
-            xaxis_title="Time (ms)",
-            yaxis_title="Request #",
-            height=max(500, len(display_df) * 20),
-            hovermode='closest'
+        # Shared hover template; Plotly.js fills in each bar's values
+        hover_template = (
+            "<b>%{customdata[0]}</b><br>"
+            "Type: %{customdata[1]}<br>"
+            "Duration: %{x:.1f}ms<br>"
+            "Start: %{customdata[2]:.1f}ms<br>"
+            "Status: %{customdata[3]}<extra></extra>"
         )
+        endpoints = WaterfallChart._short_endpoints(display_df)
+        relative_starts = display_df['relative_start'].to_numpy(dtype='float64')
         
-        fig.update_yaxes(
-            tickmode='linear',
-            tick0=0,
-            dtick=1,
-            autorange='reversed'
+        # A single bar trace for all requests, colored per bar
+        trace = dict(
+            type='bar',
+            x=display_df['total_time'].to_numpy(),
+            y=display_df.index.to_numpy(),
+            orientation='h',
+            marker=dict(color=colors.to_numpy()),
+            customdata=np.column_stack((
+                endpoints,
+                display_df['resource_type'].astype(str).to_numpy(),
+                relative_starts,
+                display_df['status'].to_numpy()
+            )),
+            hovertemplate=hover_template,
+            showlegend=False,
+            base=relative_starts,
+            width=0.8
         )
         
+        fig = go.Figure(data=[trace], layout=_SIMPLIFIED_WATERFALL_LAYOUT)
+        fig.layout.height = max(500, len(display_df) * 20)
+        
         return fig, "simplified_waterfall"
     
     @staticmethod
@@ -229,22 +362,21 @@ class WaterfallChart:
             }
         
         try:
-            df['start_time'] = pd.to_datetime(df['started_datetime'])
-            df = df.sort_values('start_time')
+            # Work on local arrays in start order; the shared session frame is
+            # not modified (this runs alongside other views in worker threads)
+            start_ns = WaterfallChart._to_ns(WaterfallChart._start_times(df))
+            order = np.argsort(start_ns, kind='stable')
+            start_ns = start_ns[order]
             
-            # Calculate end times
-            df['end_time'] = df['start_time'] + pd.to_timedelta(df['total_time'], unit='ms')
+            # Calculate end times in int64 nanoseconds (missing durations count as 0)
+            duration_ms = np.nan_to_num(df['total_time'].to_numpy(dtype='float64')[order])
+            end_ns = start_ns + np.rint(duration_ms * 1_000_000).astype('int64')
             
-            # Find overlapping requests (parallel)
-            parallel_count = 0
-            for i in range(len(df) - 1):
-                current_end = df.iloc[i]['end_time']
-                next_start = df.iloc[i + 1]['start_time']
-                
-                if next_start < current_end:
-                    parallel_count += 1
+            # Find overlapping requests (parallel): each request that starts
+            # before the previous one (in start order) has ended
+            parallel_count = WaterfallChart._count_overlaps(start_ns, end_ns)
             
-            total_duration = (df['end_time'].max() - df['start_time'].min()).total_seconds() * 1000
+            total_duration = float(end_ns.max() - start_ns[0]) / 1_000_000
             
             return {
                 'total_requests': len(df),
@@ -254,12 +386,32 @@ class WaterfallChart:
                 'total_duration_ms': round(total_duration, 2),
                 'analysis_available': True
             }
-        except:
+        except (ValueError, TypeError, KeyError) as e:
+            logger.debug(f"Request pattern analysis unavailable: {str(e)}")
             return {
                 'total_requests': len(df),
                 'analysis_available': False
             }
     
+    @staticmethod
+    def _to_ns(times: pd.Series) -> np.ndarray:
+        """View datetimes as int64 nanoseconds (UTC for tz-aware values)."""
+        return times.to_numpy(dtype='datetime64[ns]').view('int64')
+    
+    @staticmethod
+    def _count_overlaps(start_ns: np.ndarray, end_ns: np.ndarray) -> int:
+        """
+        Count requests that start before the previous request has ended.
+        
+        Args:
+            start_ns: Start times in nanoseconds, sorted ascending
+            end_ns: Matching end times in nanoseconds
+            
+        Returns:
+            Number of overlapping (parallel) requests
+        """
+        return int(np.count_nonzero(start_ns[1:] < end_ns[:-1]))
+    
     @staticmethod
     def identify_critical_path(df: pd.DataFrame) -> List[Dict]:
         """
@@ -274,7 +426,21 @@ class WaterfallChart:
         if df.empty:
             return []
         
-        # Sort by total time and get top 10 slowest
-        critical_requests = df.nlargest(10, 'total_time')
+        # Select the 10 slowest with an O(N) partition instead of a full sort,
+        # keeping nlargest's order (slowest first, ties by position)
+        values = df['total_time'].to_numpy(dtype='float64')
+        positions = np.flatnonzero(~np.isnan(values))
+        values = values[positions]
+        k = min(10, len(values))
+        if k == 0:
+            return []
+        
+        threshold = np.partition(values, len(values) - k)[len(values) - k]
+        above = np.flatnonzero(values > threshold)
+        ties = np.flatnonzero(values == threshold)[:k - len(above)]
+        top = np.sort(np.concatenate((above, ties)))
+        top = top[np.argsort(-values[top], kind='stable')]
+        
+        critical_requests = df.iloc[positions[top]]
         
-        return critical_requests[['endpoint', 'total_time', 'status']].to_dict('records')
+        return widen_float32(critical_requests[['endpoint', 'total_time', 'status']]).to_dict('records')